@@ -0,0 +1,120 @@
+from .core import as_points
+from .monotone_chain import monotone_chain_hull
+from .jarvis import direction_correct
+
+
+def chan(points, executor=None):
+    """
+        Convex hull by Chan's algorithm in O(n log h): the monotone chain on groups of m points, then Jarvis' march over
+        the group hulls, finding the next vertex in each by binary search; m is squared until the wrap closes within m steps.
+
+        The hull is clockwise from the leftmost (lowest) point, like the one of Jarvis' march. If a concurrent.futures
+        executor is given, the group hulls are computed in it.
+    """
+    points = as_points(points)
+    if len(points) < 3:
+        return sorted(points)
+
+    m = 4
+    while True:
+        m = min(m * m, len(points))
+        hull = wrap(points, m, executor)
+        if hull is not None:
+            return hull
+
+
+def wrap(points, m, executor=None):
+    """Hull of points via group hulls of size m, or None if it has more than m vertices."""
+    groups = [points[i:i+m] for i in range(0, len(points), m)]
+    indices = executor.map(group_hull_indices, groups) if executor else map(group_hull_indices, groups)
+    hulls = [[group[i] for i in hull] for group, hull in zip(groups, indices)]
+
+    start = min(points, key=lambda p: p.coords)
+    group, index = next((g, i) for g, hull in enumerate(hulls) for i, p in enumerate(hull) if p is start)
+    res = [start]
+
+    for _ in range(m):
+        point = hulls[group][index]
+        next_group, next_index = group, (index + 1) % len(hulls[group])
+
+        for g, hull in enumerate(hulls):
+            if g == group:
+                continue
+
+            i = tangent(hull, point)
+            if direction_correct(point, hull[i], hulls[next_group][next_index]):
+                next_group, next_index = g, i
+
+        group, index = next_group, next_index
+        if hulls[group][index] is start:
+            return res
+
+        res.append(hulls[group][index])
+
+    return None
+
+
+def group_hull(points):
+    """Clockwise strictly convex hull of a group, which may be degenerate."""
+    return monotone_chain_hull(points)[::-1]
+
+
+def group_hull_indices(points):
+    """
+        Positions in the group of the vertices of group_hull. An executor of other processes hands back copies of the points,
+        so the wrap maps these positions to the caller's points, whose identity it relies on.
+    """
+    positions = {id(point): i for i, point in enumerate(points)}
+    return [positions[id(point)] for point in group_hull(points)]
+
+
+def tangent(hull, point):
+    """
+        Index of the vertex of a clockwise convex hull that Jarvis' march would choose next from an outer point,
+        found by binary search on the hull's edges.
+    """
+    n = len(hull)
+
+    def better(i, j):
+        """Whether vertex i would be chosen over vertex j."""
+        return direction_correct(point, hull[i % n], hull[j % n])
+
+    def up(i):
+        """Whether moving along the edge i -> i+1 leads to a better vertex."""
+        return better(i + 1, i)
+
+    if n < 3 or not up(0) and not better(-1, 0):
+        return _climb(hull, point, 0)
+
+    # The vertices get better along one contiguous arc of edges and worse along the other; keep the best in [low, high]
+    low, high = 0, n
+    while high - low > 1:
+        mid = (low + high) // 2
+        up_mid = up(mid)
+        if not up_mid and not better(mid - 1, mid):
+            return mid
+
+        if up(low):
+            if not up_mid or better(low, mid):
+                high = mid
+            else:
+                low = mid
+        else:
+            if up_mid or better(low, mid):
+                low = mid
+            else:
+                high = mid
+
+    return _climb(hull, point, low)
+
+
+def _climb(hull, point, i):
+    """Walk from vertex i to the neighbouring vertices while they are better, which settles plateaus of collinear vertices."""
+    n = len(hull)
+    while True:
+        if direction_correct(point, hull[(i+1) % n], hull[i]):
+            i = (i + 1) % n
+        elif direction_correct(point, hull[(i-1) % n], hull[i]):
+            i = (i - 1) % n
+        else:
+            return i
@@ -1,16 +1,20 @@
+from array import array
+from copy import copy
 from enum import Enum
-from math import inf, pi, acos, atan2, isclose
+from math import inf, pi, acos, atan2, hypot, isclose
 from typing import Iterable, Generator
 
 
 class PyCGAObject(object):
     """A class to conveniently distinguish PyCompGeomAlgorithms library objects."""
-    pass
+    __slots__ = ()
 
 
 class Vector(PyCGAObject):
+    __slots__ = ("coords",)
+
     def __init__(self, *coords: Iterable[float]):
-        self.coords = tuple(coords)
+        self.coords = coords
     
     @property
     def x(self):
@@ -26,7 +30,7 @@ class Vector(PyCGAObject):
     
     @classmethod
     def from_points(cls, point1, point2):
-        return cls(*(point2 - point1).coords)
+        return cls(*(c2 - c1 for c1, c2 in zip(point1.coords, point2.coords)))
     
     @classmethod
     def dot_product(cls, vector1, vector2):
@@ -68,21 +72,62 @@ class Vector(PyCGAObject):
 
 
 class Point(PyCGAObject):
+    # A 2D point keeps its coordinates in slots of its own rather than in a separate tuple, which _coords holds otherwise;
+    # _x and _y mirror the first coordinates of a point of any dimension and are read through the read-only x and y
+    __slots__ = ("_x", "_y", "_coords")
+
     def __init__(self, *coords: Iterable[float]):
-        self.coords = tuple(coords)
-    
+        if len(coords) == 2:
+            self._x, self._y = coords
+            self._coords = None
+        else:
+            self.coords = coords
+
+    @property
+    def coords(self):
+        coords = self._coords
+        return (self._x, self._y) if coords is None else coords
+
+    @coords.setter
+    def coords(self, coords):
+        coords = tuple(coords)
+        if len(coords) == 2:
+            self._x, self._y = coords
+            self._coords = None
+            return
+
+        self._coords = coords
+        for i, name in enumerate(("_x", "_y")):
+            if i < len(coords):
+                setattr(self, name, coords[i])
+            elif hasattr(self, name):
+                delattr(self, name)
+
     @property
     def x(self):
-        return self.coords[0]
-    
+        try:
+            return self._x
+        except AttributeError:
+            raise IndexError("tuple index out of range") from None
+
     @property
     def y(self):
-        return self.coords[1]
-    
+        try:
+            return self._y
+        except AttributeError:
+            raise IndexError("tuple index out of range") from None
+
     @property
     def z(self):
         return self.coords[2]
     
+    @classmethod
+    def _from_coords(cls, coords):
+        """Construct a point from a ready coordinate tuple, bypassing argument packing."""
+        point = cls.__new__(cls)
+        point.coords = coords
+        return point
+
     @classmethod
     def centroid(cls, *points):
         return cls(*(sum(coord) / len(coord) for coord in zip(*points)))
@@ -108,6 +153,9 @@ class Point(PyCGAObject):
     @classmethod
     def dist(cls, point, obj, metric="euclidean"):
         if isinstance(obj, cls):
+            if metric == "euclidean" and point._coords is None and obj._coords is None:
+                return hypot(point._x - obj._x, point._y - obj._y)
+
             try:
                 p = {
                     "manhattan": 1,
@@ -136,10 +184,9 @@ class Point(PyCGAObject):
 
     @staticmethod
     def direction(point1, point2, point3):
-        v1 = Vector.from_points(point1, point3)
-        v2 = Vector.from_points(point1, point2)
-
-        return Vector.cross_product(v1, v2)
+        """Cross product of vectors point1->point3 and point1->point2, computed on raw coordinates."""
+        x1, y1 = point1._x, point1._y
+        return (point3._x - x1) * (point2._y - y1) - (point3._y - y1) * (point2._x - x1)
 
     def __len__(self):
         return len(self.coords)
@@ -156,13 +203,19 @@ class Point(PyCGAObject):
     def __lt__(self, other):
         if not isinstance(other, self.__class__):
             raise TypeError(f'right operand of "<" must be of {self.__class__} type')
-        
+
+        if self._coords is None and other._coords is None:
+            return self._x < other._x or self._x == other._x and self._y < other._y
+
         return self.coords < other.coords
     
     def __gt__(self, other):
         if not isinstance(other, self.__class__):
             raise TypeError(f'right operand of ">" must be of {self.__class__} type')
 
+        if self._coords is None and other._coords is None:
+            return self._x > other._x or self._x == other._x and self._y > other._y
+
         return self.coords > other.coords
     
     def __le__(self, other):
@@ -181,13 +234,19 @@ class Point(PyCGAObject):
         if not isinstance(other, self.__class__):
             raise TypeError(f"right operand of addition must be of {self.__class__} type")
         
-        return self.__class__(*(c1 + c2 for c1, c2 in zip(self.coords, other.coords)))
+        if self._coords is None:
+            return self._from_coords((self._x + other._x, self._y + other._y))
+
+        return self._from_coords(tuple(a + b for a, b in zip(self.coords, other.coords)))
     
     def __sub__(self, other):
         if not isinstance(other, self.__class__):
             raise TypeError(f"right operand of subtraction must be of {self.__class__} type")
         
-        return self.__class__(*(c1 - c2 for c1, c2 in zip(self.coords, other.coords)))
+        if self._coords is None:
+            return self._from_coords((self._x - other._x, self._y - other._y))
+
+        return self._from_coords(tuple(a - b for a, b in zip(self.coords, other.coords)))
     
     def __hash__(self):
         return hash(self.coords)
@@ -199,6 +258,111 @@ class Point(PyCGAObject):
         return str(self)
 
 
+class PointArray(PyCGAObject):
+    """A contiguous float64 buffer of N d-dimensional points with batched predicates."""
+    def __init__(self, coords=(), dim=2):
+        self.dim = dim
+        self.coords = coords if isinstance(coords, array) and coords.typecode == "d" else array("d", coords)
+
+        if len(self.coords) % dim:
+            raise ValueError(f"buffer length must be a multiple of dimension {dim}")
+
+    @classmethod
+    def from_points(cls, points):
+        if isinstance(points, cls):
+            return points
+
+        points = list(points)
+        dim = len(points[0]) if points else 2
+        coords = array("d")
+        for point in points:
+            coords.extend(point.coords)
+
+        return cls(coords, dim)
+
+    def to_points(self):
+        return list(self)
+
+    @property
+    def xs(self):
+        return self.coords[0::self.dim]
+
+    @property
+    def ys(self):
+        return self.coords[1::self.dim]
+
+    def direction(self, point1, point2):
+        """Point.direction(point1, point2, p) for every point p of the array."""
+        x1, y1 = point1.x, point1.y
+        dx, dy = point2.x - x1, point2.y - y1
+        return array("d", ((x - x1) * dy - (y - y1) * dx for x, y in zip(self.xs, self.ys)))
+
+    def dist(self, point, metric="euclidean"):
+        """Point.dist(p, point, metric) for every point p of the array."""
+        try:
+            p = {
+                "manhattan": 1,
+                "euclidean": 2,
+                "chebyshev": inf
+            }[metric]
+        except KeyError:
+            raise ValueError(f'unknown metric "{metric}"')
+
+        dim, coords, origin = self.dim, self.coords, point.coords
+        rows = (coords[i:i+dim] for i in range(0, len(coords), dim))
+
+        if p == inf:
+            return array("d", (max(abs(c1-c2) for c1, c2 in zip(row, origin)) for row in rows))
+
+        return array("d", (sum(abs((c1-c2)**p) for c1, c2 in zip(row, origin)) ** (1 / p) for row in rows))
+
+    def polar_angle(self, origin):
+        """Point.polar_angle(p, origin) for every point p of the array."""
+        x0, y0 = origin.x, origin.y
+        return array("d", (atan2(y-y0, x-x0) for x, y in zip(self.xs, self.ys)))
+
+    def centroid(self):
+        n = len(self)
+        return Point(*(sum(self.coords[i::self.dim]) / n for i in range(self.dim)))
+
+    def __len__(self):
+        return len(self.coords) // self.dim
+
+    def __getitem__(self, key):
+        n = len(self)
+        if isinstance(key, slice):
+            coords = array("d")
+            for i in range(*key.indices(n)):
+                coords.extend(self.coords[i*self.dim:(i+1)*self.dim])
+
+            return self.__class__(coords, self.dim)
+
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("point index out of range")
+
+        return Point(*self.coords[key*self.dim:(key+1)*self.dim])
+
+    def __iter__(self):
+        coords, dim = self.coords, self.dim
+        return (Point(*coords[i:i+dim]) for i in range(0, len(coords), dim))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.dim == other.dim and self.coords == other.coords
+
+    def __str__(self):
+        return f"[{', '.join(str(p) for p in self)}]"
+
+    def __repr__(self):
+        return str(self)
+
+
+def as_points(points):
+    """A mutable list of points, converting a PointArray if necessary."""
+    return points.to_points() if isinstance(points, PointArray) else points
+
+
 class Line2D(PyCGAObject):
     """A 2D line represented by the equation ax + by + c = 0 or y = slope * x + y_intercept."""
     def __init__(self, point1, point2):
@@ -237,6 +401,7 @@ class BinTreeNode(PyCGAObject):
         self.left = left
         self.right = right
         self.height = height
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
     
     @property
     def is_leaf(self):
@@ -278,55 +443,71 @@ class BinTreeNode(PyCGAObject):
         source.left, source.right = tmp_source_left, tmp_source_right
         destination.left, destination.right = tmp_dest_left, tmp_dest_right
 
-    def traverse_preorder(self, node=None, nodes=None):
-        if node is None:
-            node = self
-        if nodes is None:
-            nodes = []
-        
-        nodes.append(node)
+    def iter_preorder(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_inorder(self):
+        stack, node = [], self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def iter_postorder(self):
+        stack, last, node = [], None, self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+
+            peek = stack[-1]
+            if peek.right and peek.right is not last:
+                node = peek.right
+            else:
+                last = stack.pop()
+                yield last
 
-        if node.left:
-            self.traverse_preorder(node.left, nodes)
-        if node.right:
-            self.traverse_preorder(node.right, nodes)
-        
-        return nodes
+    def traverse_preorder(self, node=None, nodes=None):
+        return self._collect((node or self).iter_preorder(), nodes)
 
     def traverse_inorder(self, node=None, nodes=None):
-        if node is None:
-            node = self
-        if nodes is None:
-            nodes = []
-        
-        if node.left:
-            self.traverse_inorder(node.left, nodes)
-        
-        nodes.append(node)
-
-        if node.right:
-            self.traverse_inorder(node.right, nodes)
-        
-        return nodes
+        return self._collect((node or self).iter_inorder(), nodes)
 
     def traverse_postorder(self, node=None, nodes=None):
-        if node is None:
-            node = self
+        return self._collect((node or self).iter_postorder(), nodes)
+
+    @staticmethod
+    def _collect(iterator, nodes):
         if nodes is None:
-            nodes = []
-        
-        if node.left:
-            self.traverse_postorder(node.left, nodes)
-        if node.right:
-            self.traverse_postorder(node.right, nodes)
-        
-        nodes.append(node)
+            return list(iterator)
+
+        nodes.extend(iterator)
         return nodes
 
+    def inorder_node(self, index):
+        """The index-th node of the subtree in inorder, found by traversal since children may be attached without updating sizes."""
+        try:
+            return self.traverse_inorder()[index]
+        except IndexError:
+            raise IndexError("node index out of range") from None
+
     def set_height(self):
         left_height = self.left.height if self.left else 0
         right_height = self.right.height if self.right else 0
-        self.height = max(left_height, right_height) + 1 if self.left or self.right else 0        
+        self.height = max(left_height, right_height) + 1 if self.left or self.right else 0
+        self.size = 1 + (self.left.size if self.left else 0) + (self.right.size if self.right else 0)
 
     def weak_equal(self, other):
         """Weak (non-recursive) equality that only checks whether the nodes are of the same type and their contents match."""
@@ -383,14 +564,38 @@ class BinTree(PyCGAObject):
     def traverse_postorder(self):
         return self.root.traverse_postorder() if self.root else []
     
+    def iter_preorder(self):
+        return self.root.iter_preorder() if self.root else iter(())
+
+    def iter_inorder(self):
+        return self.root.iter_inorder() if self.root else iter(())
+
+    def iter_postorder(self):
+        return self.root.iter_postorder() if self.root else iter(())
+
+    def iter_leaves_preorder(self):
+        return (node for node in self.iter_preorder() if node.is_leaf)
+
+    def iter_leaves_inorder(self):
+        return (node for node in self.iter_inorder() if node.is_leaf)
+
+    def iter_leaves_postorder(self):
+        return (node for node in self.iter_postorder() if node.is_leaf)
+
     def leaves_preorder(self):
-        return [node for node in self.traverse_preorder() if node.is_leaf]
+        return list(self.iter_leaves_preorder())
     
     def leaves_inorder(self):
-        return [node for node in self.traverse_inorder() if node.is_leaf]
+        return list(self.iter_leaves_inorder())
     
     def leaves_postorder(self):
-        return [node for node in self.traverse_postorder() if node.is_leaf]
+        return list(self.iter_leaves_postorder())
+
+    def inorder_node(self, index):
+        if self.root is None:
+            raise IndexError("node index out of range")
+
+        return self.root.inorder_node(index)
     
     def __eq__(self, other):
         return isinstance(other, self.__class__) and self.root == other.root
@@ -407,23 +612,241 @@ class ThreadedBinTreeNode(BinTreeNode):
 
 
 class AVLTree(BinTree):
+    """
+        AVL tree; a persistent tree copies only the nodes on the updated paths, sharing the rest with its earlier versions,
+        which are kept as roots in versions.
+    """
+    def __init__(self, root, persistent=False):
+        super().__init__(root)
+        self.persistent = persistent
+        self.versions = []
+        self._stamp = None
+
     def insert(self, data, starting_node=None):
         if starting_node is None:
             starting_node = self.root
 
+        self._begin_update()
         self.root = self._insert(data, starting_node)
     
     def delete(self, data, starting_node=None):
         if starting_node is None:
             starting_node = self.root
 
+        self._begin_update()
         self.root = self._delete(data, starting_node)
 
+    def snapshot(self):
+        """An O(1) copy sharing all nodes with the tree; both trees become persistent so that neither affects the other."""
+        self.persistent = True
+        return self.__class__(self.root, persistent=True)
+
+    def version(self, index):
+        """The tree as it was before the index-th update since it became persistent."""
+        return self.__class__(self.versions[index], persistent=True)
+
+    def _begin_update(self):
+        if self.persistent:
+            self.versions.append(self.root)
+            self._stamp = object()
+
+    def _mutable(self, node):
+        """The node itself, or in a persistent tree, its copy private to the current update."""
+        if not self.persistent or node is None or getattr(node, "_stamp", None) is self._stamp:
+            return node
+
+        node = copy(node)
+        node._stamp = self._stamp
+        return node
+
+    def rank(self, value, inclusive=False):
+        """Number of nodes whose data is less than (or, if inclusive, not greater than) value."""
+        res, node = 0, self.root
+        while node:
+            if value < node.data or not inclusive and not node.data < value:
+                node = node.left
+            else:
+                res += 1 + (node.left.size if node.left else 0)
+                node = node.right
+
+        return res
+
+    def inorder_node(self, index):
+        """The index-th node in inorder, found in O(height) by the subtree sizes that the tree's updates maintain."""
+        size = self.root.size if self.root else 0
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("node index out of range")
+
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def select(self, index):
+        """Data of the index-th smallest node."""
+        return self.inorder_node(index).data
+
+    def count_range(self, low, high):
+        """Number of nodes whose data lies in the closed range [low, high]."""
+        return max(self.rank(high, inclusive=True) - self.rank(low), 0)
+
+    @classmethod
+    def join(cls, left, pivot, right):
+        """
+            Join two trees and a pivot, where every key of left is less than the pivot and every key of right is greater.
+            
+            Runs in O(|height(left) - height(right)| + 1); the input trees are consumed.
+        """
+        tree = cls(None)
+        tree.root = tree._join(left.root, tree._make_node(pivot), right.root)
+        return tree
+
+    def split(self, key):
+        """
+            Split the tree by key into a tree of lesser keys, the data equal to key (or None) and a tree of greater keys.
+            
+            Runs in O(log n); the tree is consumed.
+        """
+        self._begin_update()
+        left, node, right = self._split(self.root, key)
+        self.root = None
+        return self.__class__(left, self.persistent), node.data if node else None, self.__class__(right, self.persistent)
+
+    def union(self, other, executor=None, parallel_depth=2):
+        """
+            Merge the keys of other into the tree in O(m log(n/m + 1)), keeping a single copy of keys present in both.
+            
+            If a concurrent.futures executor is given, independent subtrees of the top parallel_depth levels are merged in it.
+        """
+        self._begin_update()
+        self.root = self._union(self.root, other.root, executor, parallel_depth)
+        other.root = None
+
+    def difference(self, other, executor=None, parallel_depth=2):
+        """Remove the keys of other from the tree in O(m log(n/m + 1)); see union for executor semantics."""
+        self._begin_update()
+        self.root = self._difference(self.root, other.root, executor, parallel_depth)
+        other.root = None
+
+    def insert_many(self, iterable, executor=None, parallel_depth=2):
+        """Insert the keys of iterable that are not already present by building a balanced tree of them and taking the union."""
+        items = []
+        for item in sorted(iterable):
+            if not items or items[-1] < item:
+                items.append(item)
+
+        self.union(self.from_iterable(items), executor, parallel_depth)
+
+    def _make_node(self, data):
+        if isinstance(data, BinTreeNode):
+            data = self._mutable(data)
+            data.left, data.right = None, None
+            data.set_height()
+            return data
+
+        return self.node_class(data)
+
+    def _join(self, left, pivot, right):
+        left_height, right_height = left.height if left else 0, right.height if right else 0
+        if left_height > right_height + 1:
+            left = self._mutable(left)
+            left.right = self._join(left.right, pivot, right)
+            left.set_height()
+            return self.rebalance(left)
+        if right_height > left_height + 1:
+            right = self._mutable(right)
+            right.left = self._join(left, pivot, right.left)
+            right.set_height()
+            return self.rebalance(right)
+
+        pivot.left, pivot.right = left, right
+        pivot.set_height()
+        return pivot
+
+    def _join_without_pivot(self, left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        right, pivot = self._pop_leftmost(right)
+        return self._join(left, pivot, right)
+
+    def _pop_leftmost(self, node):
+        node = self._mutable(node)
+        if node.left is None:
+            right = node.right
+            node.right = None
+            node.set_height()
+            return right, node
+
+        node.left, leftmost = self._pop_leftmost(node.left)
+        node.set_height()
+        return self.rebalance(node), leftmost
+
+    def _split(self, node, key):
+        if node is None:
+            return None, None, None
+
+        left, right = node.left, node.right
+        if key < node.data:
+            left_part, found, right_part = self._split(left, key)
+            return left_part, found, self._join(right_part, self._make_node(node), right)
+        if node.data < key:
+            left_part, found, right_part = self._split(right, key)
+            return self._join(left, self._make_node(node), left_part), found, right_part
+
+        return left, self._make_node(node), right
+
+    def _fork(self, executor, depth, function, *args):
+        """Run function(*args) in the executor while depth allows, otherwise in place; returns a result getter."""
+        if executor is not None and depth > 0:
+            # The forked tree shares persistence and the update's stamp, so it copies nodes of earlier versions too
+            tree = copy(self)
+            tree.root, tree.versions = None, []
+            future = executor.submit(getattr(tree, function.__name__), *args, None, 0)
+            return future.result
+
+        result = function(*args, executor, depth - 1)
+        return lambda: result
+
+    def _union(self, node1, node2, executor=None, depth=0):
+        if node1 is None:
+            return node2
+        if node2 is None:
+            return node1
+
+        left1, right1 = node1.left, node1.right
+        left2, _, right2 = self._split(node2, node1.data)
+        left = self._fork(executor, depth, self._union, left1, left2)
+        right = self._union(right1, right2, executor, depth - 1)
+
+        return self._join(left(), self._make_node(node1), right)
+
+    def _difference(self, node1, node2, executor=None, depth=0):
+        if node1 is None or node2 is None:
+            return node1
+
+        left1, _, right1 = self._split(node1, node2.data)
+        left = self._fork(executor, depth, self._difference, left1, node2.left)
+        right = self._difference(right1, node2.right, executor, depth - 1)
+
+        return self._join_without_pivot(left(), right)
+
     def _insert(self, data, node=None):
         data_is_node = isinstance(data, self.node_class)
         if node is None:
-            return data if data_is_node else BinTreeNode(data)
+            return data if data_is_node else self.node_class(data)
         
+        node = self._mutable(node)
         value = data.data if data_is_node else data
         if value < node.data:
             node.left = self._insert(data, node.left)
@@ -437,6 +860,7 @@ class AVLTree(BinTree):
         if node is None:
             return None
         
+        node = self._mutable(node)
         if data < node.data:
             node.left = self._delete(data, node.left)
         elif data > node.data:
@@ -478,7 +902,8 @@ class AVLTree(BinTree):
         return node
 
     def _rotate_left(self, node):
-        heavy_node = node.right
+        node = self._mutable(node)
+        heavy_node = self._mutable(node.right)
         swapped_subnode = heavy_node.left
         heavy_node.left = node
         node.right = swapped_subnode
@@ -489,7 +914,8 @@ class AVLTree(BinTree):
         return heavy_node
     
     def _rotate_right(self, node):
-        heavy_node = node.left
+        node = self._mutable(node)
+        heavy_node = self._mutable(node.left)
         swapped_subnode = heavy_node.right
         heavy_node.right = node
         node.left = swapped_subnode
@@ -501,25 +927,166 @@ class AVLTree(BinTree):
 
 
 class ThreadedBinTree(AVLTree):
+    """
+        AVL tree whose nodes link to their children, or, lacking a child, to their inorder predecessor and successor.
+        
+        Insertion, deletion and rotations patch the links locally, so they stay O(log n).
+    """
     node_class = ThreadedBinTreeNode
+    circular = True
+
+    def __init__(self, root, persistent=False):
+        if persistent:
+            raise TypeError("threaded trees link nodes across the whole tree and cannot share them between versions")
+
+        super().__init__(root)
+
+    def snapshot(self):
+        raise TypeError("threaded trees link nodes across the whole tree and cannot share them between versions")
 
     @classmethod
     def from_iterable(cls, iterable, circular=True):
         tree = super().from_iterable(iterable)
-        nodes = tree.traverse_inorder()
+        tree.circular = circular
+        tree.rethread()
+        
+        return tree
+
+    def rethread(self):
+        """Rebuild all the links in O(n) from the tree structure."""
+        nodes = self.traverse_inorder()
         
         for i, node in enumerate(nodes):            
             node.prev = node.left if node.left else nodes[i-1]
             node.next = node.right if node.right else nodes[(i+1)%len(nodes)]
         
-        if not circular and nodes:
+        if not self.circular and nodes:
             nodes[0].prev = None
             nodes[-1].next = None
-        
+
+    def union(self, other, executor=None, parallel_depth=2):
+        super().union(other, executor, parallel_depth)
+        self.rethread()
+
+    def difference(self, other, executor=None, parallel_depth=2):
+        super().difference(other, executor, parallel_depth)
+        self.rethread()
+
+    @classmethod
+    def join(cls, left, pivot, right):
+        tree = super().join(left, pivot, right)
+        tree.circular = left.circular
+        tree.rethread()
         return tree
-    
+
+    def split(self, key):
+        left, data, right = super().split(key)
+        for tree in left, right:
+            tree.circular = self.circular
+            tree.rethread()
+
+        return left, data, right
+
+    @staticmethod
+    def predecessor(node):
+        return node.left.rightmost_node if node.left else node.prev
+
+    @staticmethod
+    def successor(node):
+        return node.right.leftmost_node if node.right else node.next
+
+    def _insert(self, data, node=None):
+        new_node = data if isinstance(data, self.node_class) else self.node_class(data)
+        if node is None:
+            new_node.prev = new_node.next = new_node if self.circular else None
+            return new_node
+
+        if new_node.data < node.data:
+            if node.left:
+                node.left = self._insert(new_node, node.left)
+            else:
+                predecessor = node.prev
+                new_node.prev, new_node.next = predecessor, node
+                node.left = new_node
+                if predecessor is not None and predecessor.right is None:
+                    predecessor.next = new_node
+
+            node.prev = node.left
+        else:
+            if node.right:
+                node.right = self._insert(new_node, node.right)
+            else:
+                successor = node.next
+                new_node.prev, new_node.next = node, successor
+                node.right = new_node
+                if successor is not None and successor.left is None:
+                    successor.prev = new_node
+
+            node.next = node.right
+
+        node.set_height()
+        return self.rebalance(node)
+
+    def _delete(self, data, node):
+        if node is None:
+            return None
+
+        if data < node.data:
+            node.left = self._delete(data, node.left)
+            node.prev = node.left if node.left else node.prev
+        elif data > node.data:
+            node.right = self._delete(data, node.right)
+            node.next = node.right if node.right else node.next
+        elif node.left and node.right:
+            prev, next = node.prev, node.next
+            BinTreeNode.copy_contents_without_children(node.right.leftmost_node, node)
+            node.prev, node.next = prev, next
+
+            node.right = self._delete_leftmost(node.right)
+            node.next = node.right if node.right else node.next
+        else:
+            return self._unlink(node)
+
+        node.set_height()
+        return self.rebalance(node)
+
+    def _delete_leftmost(self, node):
+        if node.left is None:
+            return self._unlink(node)
+
+        node.left = self._delete_leftmost(node.left)
+        node.prev = node.left if node.left else node.prev
+        node.set_height()
+        return self.rebalance(node)
+
+    def _unlink(self, node):
+        """Detach a node with at most one child, linking its inorder neighbours to each other; returns the child."""
+        predecessor, successor = self.predecessor(node), self.successor(node)
+        if predecessor is node:
+            return None
+
+        # A parent whose child is being detached is relinked to the child itself by the caller, if there is one
+        if predecessor is not None and (predecessor.right is None or predecessor.right is node):
+            predecessor.next = successor
+        if successor is not None and (successor.left is None or successor.left is node):
+            successor.prev = predecessor
+
+        return node.left if node.left else node.right
+
+    def _rotate_left(self, node):
+        heavy_node = super()._rotate_left(node)
+        heavy_node.prev = node
+        node.next = node.right if node.right else heavy_node
+        return heavy_node
+
+    def _rotate_right(self, node):
+        heavy_node = super()._rotate_right(node)
+        heavy_node.next = node
+        node.prev = node.left if node.left else heavy_node
+        return heavy_node
+
     def __repr__(self):
-        return ", ".join([repr(node.data) for node in self.traverse_inorder()])
+        return ", ".join(repr(node.data) for node in self.iter_inorder())
 
 
 class PathDirection(PyCGAObject, str, Enum):
@@ -553,36 +1120,51 @@ class PointType(PyCGAObject, Enum):
 
     @classmethod
     def by_points(cls, source, target, left, right):
-        def polar_angle(point):
-            """[0, 2*pi) polar angle in coordinate system with axis target -> source (rotated against x axis by rot)"""
-            rot = Point.nonnegative_polar_angle(source, target)
-            angle = Point.nonnegative_polar_angle(point, target)
-            return angle - rot + (2 * pi if angle < rot else 0)
-        
-        angles = polar_angle(left), polar_angle(right)
-        angle1 = min(angles)
-        angle2 = max(angles)
-
-        convex_or_reflex = 0 < angle1 <= pi <= angle2 < 2 * pi
-
-        # Convex
-        if convex_or_reflex and angle2 < angle1 + pi:
+        """
+            Classify target against source by the angles of left and right measured counterclockwise
+            from the ray target -> source, using orientation tests only.
+            A point that coincides with target, as a repeated hull vertex does, is taken along the x axis from it,
+            as atan2(0, 0) = 0 made it before.
+        """
+        def ray(point):
+            return Point(target.x + 1, target.y) if point.x == target.x and point.y == target.y else point
+
+        source, left, right = ray(source), ray(left), ray(right)
+
+        def half(point):
+            """0 for angle 0, 1 for (0, pi), 2 for pi, 3 for (pi, 2*pi)."""
+            side = Point.direction(target, point, source)
+            if side > 0:
+                return 1
+            if side < 0:
+                return 3
+
+            dot = (source.x - target.x) * (point.x - target.x) + (source.y - target.y) * (point.y - target.y)
+            return 2 if dot < 0 else 0
+
+        half1, half2 = half(left), half(right)
+        if half1 > half2:
+            half1, half2 = half2, half1
+            left, right = right, left
+
+        # Cross product of target->left and target->right, i.e. whether the right angle exceeds the left one by less than pi
+        turn = Point.direction(target, right, left)
+
+        if half1 == 0:
+            if half2 == 1:
+                return cls.left_supporting
+            if half2 == 3:
+                return cls.right_supporting
+        elif half1 == 1:
+            if half2 == 1 and turn != 0:
+                return cls.left_supporting
+            if half2 == 2 or half2 == 3 and turn > 0:
+                return cls.convex
+            if half2 == 3 and turn < 0:
+                return cls.reflex
+        elif half1 == 2:
             return cls.convex
-        
-        # Reflex
-        if convex_or_reflex and angle2 > angle1 + pi:
-            return cls.reflex
-
-        # Left supporting
-        if 0 <= angle1 < angle2 < pi:
-            return cls.left_supporting
-        
-        # Right supporting
-        if angle1 == 0:
-            angle1 = 2 * pi
-            angle1, angle2 = angle2, angle1
-        
-        if pi < angle1 < angle2 <= 2 * pi:
+        elif turn != 0:
             return cls.right_supporting
-        
-        raise ValueError
\ No newline at end of file
+
+        raise ValueError
@@ -1,6 +1,9 @@
-from copy import deepcopy
-from .core import PathDirection, BinTreeNode, AVLTree, ThreadedBinTree, ThreadedBinTreeNode, PointType, Point
+from copy import copy
+from fractions import Fraction
+from itertools import islice
+from .core import PyCGAObject, PathDirection, BinTreeNode, AVLTree, ThreadedBinTree, ThreadedBinTreeNode, PointType, Point
 from .jarvis import jarvis
+from .predicates import robust_predicates_enabled, stats
 
 
 class DynamicHullNode(BinTreeNode):
@@ -29,8 +32,7 @@ class DynamicHullNode(BinTreeNode):
 
     @property
     def left_supporting(self):
-        subhull = self.subhull.traverse_inorder()
-        return self._left_supporting if self._left_supporting else subhull[self.left_supporting_index].point
+        return self._left_supporting if self._left_supporting else self.subhull.inorder_node(self.left_supporting_index).point
     
     @left_supporting.setter
     def left_supporting(self, value):
@@ -42,9 +44,8 @@ class DynamicHullNode(BinTreeNode):
 
     @property
     def right_supporting(self):
-        subhull = self.subhull.traverse_inorder()
         try:
-            return self._right_supporting if self._right_supporting else subhull[self.left_supporting_index+1].point
+            return self._right_supporting if self._right_supporting else self.subhull.inorder_node(self.left_supporting_index+1).point
         except IndexError:
             return self.left_supporting
     
@@ -80,7 +81,7 @@ class DynamicHullNode(BinTreeNode):
         )
     
     def __repr__(self):
-        return ", ".join(repr(node.point) for node in self.subhull.traverse_inorder())
+        return ", ".join(repr(node.point) for node in self.subhull.iter_inorder())
 
 
 class DynamicHullTree(AVLTree):
@@ -114,15 +115,20 @@ class DynamicHullTree(AVLTree):
         if path is None:
             path = []
         
+        self._begin_update()
         self.root = self._insert(point, starting_node, path)
     
     def _insert(self, point, node, path):
         if node.is_leaf:
-            node_copy = deepcopy(node)
-            new_node = DynamicHullNode.leaf(point)
-            node.left = new_node if point < node.point else node_copy
-            node.right = node_copy if point < node.point else new_node
-        elif point < node.point:
+            # The leaf itself becomes a child of a placeholder that is replaced on merging
+            leaf, new_node = node, DynamicHullNode.leaf(point)
+            node = copy(leaf)
+            node.left = new_node if point < leaf.point else leaf
+            node.right = leaf if point < leaf.point else new_node
+            return self._merge_with_rebalance(node)
+
+        node = self._mutable(node)
+        if point < node.point:
             path.append(PathDirection.left)
             node.left = self._insert(point, node.left, path)
         else:
@@ -137,12 +143,15 @@ class DynamicHullTree(AVLTree):
         if path is None:
             path = []
         
+        self._begin_update()
         self.root = self._delete(point, starting_node, path)
     
     def _delete(self, point, node, path):
         if node.is_leaf:
             return None
-        elif point <= node.point:
+
+        node = self._mutable(node)
+        if point <= node.point:
             path.append(PathDirection.left)
             node.left = self._delete(point, node.left, path)
         else:
@@ -165,11 +174,44 @@ class DynamicHullTree(AVLTree):
 
             # Re-evaluate lower subhulls affected by rebalancing
             if (bf == 2) or (bf == -2 and left_bf == 1):
-                node.left = merge(node.left.left, node.left.right)
+                node.left = self._merge(node.left.left, node.left.right)
             if (bf == -2) or (bf == 2 and right_bf == -1):
-                node.right = merge(node.right.left, node.right.right)
+                node.right = self._merge(node.right.left, node.right.right)
+
+        return self._merge(node.left, node.right)
+
+    def _merge(self, node1, node2):
+        node = merge(node1, node2)
+        node._stamp = self._stamp
+        return node
+
+    def optimize_updated_nodes(self):
+        """
+            Recompute optimized subhulls after an update of a persistent tree, visiting only the nodes created by it.
+            
+            Shared children of those nodes are copied first, since their optimized subhulls depend on the new parents.
+        """
+        if self.root is None:
+            return
+
+        self.root = self._mutable(self.root)
+        self.root.optimized_subhull = self.root.subhull
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            for attr in ("left", "right"):
+                child = getattr(node, attr)
+                if child is None:
+                    continue
 
-        return merge(node.left, node.right)
+                if getattr(child, "_stamp", None) is self._stamp:
+                    stack.append(child)
+                else:
+                    child = self._mutable(child)
+                    setattr(node, attr, child)
+
+                optimize_subhull(child, node)
 
 
 class SubhullNode(ThreadedBinTreeNode):
@@ -194,10 +236,20 @@ class SubhullThreadedBinTree(ThreadedBinTree):
         return super().from_iterable(iterable, circular)
 
 
-def upper_dynamic_hull(points, point_to_insert_or_delete):
+def upper_dynamic_hull(points, point_to_insert_or_delete, trace=True):
+    """Yield the steps of the dynamic upper hull maintenance, or with trace=False, only the resulting upper hull."""
     points.sort()
 
     tree = DynamicHullTree.from_iterable(points)
+    if not trace:
+        if point_to_insert_or_delete in points:
+            tree.delete(point_to_insert_or_delete)
+        else:
+            tree.insert(point_to_insert_or_delete)
+
+        yield [n.point for n in tree.root.subhull.iter_inorder()]
+        return
+
     optimize_dynamic_hull_tree(tree.root)
     yield tree.leaves_inorder()
     yield tree
@@ -207,7 +259,7 @@ def upper_dynamic_hull(points, point_to_insert_or_delete):
     yield tree
 
     path = []
-    modified_tree = deepcopy(tree)
+    modified_tree = tree.snapshot()
     if point_to_insert_or_delete in points:
         modified_tree.delete(point_to_insert_or_delete, path=path)
     else:
@@ -215,7 +267,7 @@ def upper_dynamic_hull(points, point_to_insert_or_delete):
     
     yield path
 
-    optimize_dynamic_hull_tree(modified_tree.root)
+    modified_tree.optimize_updated_nodes()
     hull = [n.point for n in modified_tree.root.subhull.traverse_inorder()]
 
     yield modified_tree, hull
@@ -232,16 +284,17 @@ def merge(node1, node2):
         prev1, prev2 = subhull_node1, subhull_node2
         subhull_node1, subhull_node2 = next_nodes(subhull_node1, subhull_node2)
     
-    subhull_nodes1, subhull_nodes2 = node1.subhull.traverse_inorder(), node2.subhull.traverse_inorder()
-    subhull = [
-        node.point for node in
-        subhull_nodes1[:subhull_nodes1.index(prev1)+1] + subhull_nodes2[subhull_nodes2.index(prev2):]
-    ]
+    # Subhulls are ordered by x, so the supporting points' positions are their ranks
+    index1, index2 = node1.subhull.rank(prev1.point), node2.subhull.rank(prev2.point)
+    subhull = (
+        [node.point for node in islice(node1.subhull.iter_inorder(), index1+1)] +
+        [node.point for node in islice(node2.subhull.iter_inorder(), index2, None)]
+    )
     
     joint_node = DynamicHullNode(
         data=node1.rightmost_node.point,
         subhull_points=subhull,
-        left_supporting_index=subhull.index(prev1.point)
+        left_supporting_index=index1
     )
     joint_node.left, joint_node.right = node1, node2
     joint_node.set_height()
@@ -256,8 +309,8 @@ def merge_trivial(node1, node2):
         For efficiency's sake, only use in trivial cases, such as point & point, segment & point, segment & segment, and segment & 3-chain.
     """
     subhull_root1, subhull_root2 = node1.subhull.root, node2.subhull.root
-    points1 = [node.point for node in subhull_root1.traverse_inorder()]
-    points2 = [node.point for node in subhull_root2.traverse_inorder()]
+    points1 = [node.point for node in subhull_root1.iter_inorder()]
+    points2 = [node.point for node in subhull_root2.iter_inorder()]
     points = points1 + points2
     subhull = (
         ([] if len(points) == 2 and points[0].x == points[1].x else [points[0]]) +
@@ -314,8 +367,262 @@ def _optimize_dynamic_hull_tree(node, parent_node):
 
 
 def optimize_subhull(node, parent_node):
-    node_points = [n.point for n in node.subhull.traverse_inorder()]
-    parent_points = {n.point for n in parent_node.subhull.traverse_inorder()}
-
-    filtered_points = [p for p in node_points if p not in parent_points]
+    parent_points = {n.point for n in parent_node.subhull.iter_inorder()}
+    filtered_points = [n.point for n in node.subhull.iter_inorder() if n.point not in parent_points]
     node.optimized_subhull = SubhullThreadedBinTree.from_iterable(filtered_points)
+
+
+class HullQueueNode(BinTreeNode):
+    """Node of a hull chain that also knows the first and the last vertices of its subtree."""
+    def __init__(self, data, left=None, right=None, height=0):
+        super().__init__(data, left, right, height)
+        self.first = left.first if left else data
+        self.last = right.last if right else data
+
+    def set_height(self):
+        super().set_height()
+        self.first = self.left.first if self.left else self.data
+        self.last = self.right.last if self.right else self.data
+
+
+class HullQueue(AVLTree):
+    """
+        Concatenable queue of the vertices of a hull chain in lexicographic order: a persistent AVL tree, so splitting
+        and joining chains in O(log n) leaves the chains they were taken from intact.
+    """
+    node_class = HullQueueNode
+
+    def __init__(self, root=None):
+        super().__init__(root, persistent=True)
+
+    def _begin_update(self):
+        # Chains are never mutated after they are built, so there is no history to keep
+        self._stamp = object()
+
+    def concatenate(self, left, right, sign):
+        """
+            Root of the chain made of the chains rooted at left and right, where every vertex of left precedes
+            every vertex of right; the upper chains have sign 1, the lower ones -1.
+        """
+        p, q = self.bridge(left, right, sign)
+        self._begin_update()
+        prefix, p, _ = self._split(left, p)
+        _, q, suffix = self._split(right, q)
+        return self._join(self._join(prefix, p, None), q, suffix)
+
+    @staticmethod
+    def bridge(left, right, sign):
+        """
+            The vertices of the chains rooted at left and right joined by the common tangent, found by descending
+            both trees at once in O(log n) as Overmars and van Leeuwen do.
+        """
+        p, q = left, right
+        # The vertices just outside the subtrees p and q are searched in, i.e. the neighbours of their extremes
+        p_prev = p_next = q_prev = q_next = None
+
+        while True:
+            p_point, q_point = p.data, q.data
+            before_p = p.left.last if p.left else p_prev
+            after_p = p.right.first if p.right else p_next
+            before_q = q.left.last if q.left else q_prev
+            after_q = q.right.first if q.right else q_next
+
+            # Whether a neighbour lies outside of the line pq, or on it where that makes the bridge shorter
+            p_goes_left = before_p is not None and sign * Point.direction(p_point, q_point, before_p) <= 0
+            p_goes_right = after_p is not None and sign * Point.direction(p_point, q_point, after_p) < 0
+            q_goes_left = before_q is not None and sign * Point.direction(p_point, q_point, before_q) < 0
+            q_goes_right = after_q is not None and sign * Point.direction(p_point, q_point, after_q) <= 0
+
+            if p_goes_left or q_goes_right:
+                if p_goes_left:
+                    p, p_next = p.left, p_point
+                if q_goes_right:
+                    q, q_prev = q.right, q_point
+            elif p_goes_right and q_goes_left:
+                # The edges after p and before q meet on the side of the line separating the chains where the bridge point is not
+                if _meets_right_of(p_point, after_p, before_q, q_point, left.last, right.first):
+                    q, q_next = q.left, q_point
+                else:
+                    p, p_prev = p.right, p_point
+            elif p_goes_right:
+                p, p_prev = p.right, p_point
+            elif q_goes_left:
+                q, q_next = q.left, q_point
+            else:
+                return p_point, q_point
+
+
+def _meets_right_of(a1, a2, b1, b2, s1, s2):
+    """
+        Whether the lines a1a2 and b1b2 meet lexicographically after the midpoint of s1 and s2, which is exact on integers,
+        and on floats too with robust predicates enabled, evaluating it in rational arithmetic.
+
+        Comparing y on equal x is as if the points were sheared by an infinitesimal, which makes every vertical line
+        through the midpoint separate the lexicographically lesser points from the greater ones.
+    """
+    if robust_predicates_enabled():
+        stats.calls += 1
+        stats.exact_calls += 1
+        a1, a2, b1, b2, s1, s2 = (Point(Fraction(p.x), Fraction(p.y)) for p in (a1, a2, b1, b2, s1, s2))
+
+    a_cross = a1.x * a2.y - a1.y * a2.x
+    b_cross = b1.x * b2.y - b1.y * b2.x
+    denominator = (a1.x - a2.x) * (b1.y - b2.y) - (a1.y - a2.y) * (b1.x - b2.x)
+    x = a_cross * (b1.x - b2.x) - (a1.x - a2.x) * b_cross
+    y = a_cross * (b1.y - b2.y) - (a1.y - a2.y) * b_cross
+    if denominator < 0:
+        denominator, x, y = -denominator, -x, -y
+
+    return denominator != 0 and (2 * x, 2 * y) > ((s1.x + s2.x) * denominator, (s1.y + s2.y) * denominator)
+
+
+class DynamicHullSkeletonNode(BinTreeNode):
+    """
+        Node of a leaf-oriented AVL tree over the points: a leaf holds a point, an inner node the greatest point of
+        its left subtree and the roots of the upper and lower chains of the hull of all of its points.
+    """
+    def __init__(self, data, left=None, right=None, upper=None, lower=None):
+        super().__init__(data, left, right)
+        self.set_height()
+        self.upper = upper
+        self.lower = lower
+
+    @property
+    def point(self):
+        return self.data
+
+    @property
+    def points_count(self):
+        return (self.size + 1) // 2
+
+
+class DynamicHull(PyCGAObject):
+    """
+        Fully dynamic convex hull of Overmars and van Leeuwen: insert(point) and delete(point) take O(log^2 n),
+        hull() takes O(h), and snapshot() takes O(1).
+
+        Every node of a balanced tree over the points keeps the upper and lower chains of its subtree as concatenable
+        queues; an update rebuilds the chains of the O(log n) nodes on its path, each from its children's chains
+        by finding their bridge and splitting and joining the queues in O(log n). All nodes and queues are immutable
+        once built, so earlier versions of the hull remain valid and share their structure with the current one.
+        They are kept in versions only with keep_versions=True, as each of them holds O(log^2 n) nodes of its own.
+    """
+    def __init__(self, points=(), root=None, keep_versions=False):
+        self.queue = HullQueue()
+        self.root = root
+        self.keep_versions = keep_versions
+        self.versions = []
+
+        points = sorted({p.coords: p for p in points}.values(), key=lambda p: p.coords)
+        if points:
+            self.root = self._build(points, 0, len(points))
+
+    def __len__(self):
+        return self.root.points_count if self.root else 0
+
+    def __contains__(self, point):
+        """Whether the point is one of the points of the set, not whether the hull covers it."""
+        node = self.root
+        while node and not node.is_leaf:
+            node = node.left if point.coords <= node.data.coords else node.right
+
+        return node is not None and node.data.coords == point.coords
+
+    def insert(self, point):
+        """Add a point to the set; a point equal to one already present is ignored."""
+        self._save_version()
+        self.root = self._insert(self.root, point)
+
+    def delete(self, point):
+        """Remove a point from the set; a point not present is ignored."""
+        self._save_version()
+        self.root = self._delete(self.root, point)
+
+    def snapshot(self):
+        """An O(1) copy sharing all nodes with the hull; later updates of either do not affect the other."""
+        return self.__class__(root=self.root)
+
+    def version(self, index):
+        """The hull as it was before the index-th update since versions are kept."""
+        return self.__class__(root=self.versions[index])
+
+    def _save_version(self):
+        if self.keep_versions:
+            self.versions.append(self.root)
+
+    def upper_hull(self):
+        """Vertices of the upper chain from left to right."""
+        return [node.data for node in self.root.upper.iter_inorder()] if self.root else []
+
+    def lower_hull(self):
+        """Vertices of the lower chain from left to right."""
+        return [node.data for node in self.root.lower.iter_inorder()] if self.root else []
+
+    def hull(self):
+        """The hull counterclockwise from the lexicographically least point, as monotone_chain_hull returns it."""
+        upper, lower = self.upper_hull(), self.lower_hull()
+        return lower[:-1] + upper[:0:-1] if len(lower) > 1 else lower
+
+    def _leaf(self, point):
+        node = HullQueueNode(point)
+        return DynamicHullSkeletonNode(point, upper=node, lower=node)
+
+    def _node(self, left, right):
+        return DynamicHullSkeletonNode(
+            left.upper.last, left, right,
+            self.queue.concatenate(left.upper, right.upper, 1),
+            self.queue.concatenate(left.lower, right.lower, -1)
+        )
+
+    def _build(self, points, start, stop):
+        if stop - start == 1:
+            return self._leaf(points[start])
+
+        middle = (start + stop) // 2
+        return self._node(self._build(points, start, middle), self._build(points, middle, stop))
+
+    def _balanced(self, left, right):
+        """A node with the given subtrees, rotated once or twice if their heights differ by two."""
+        if left.height > right.height + 1:
+            if left.left.height >= left.right.height:
+                return self._node(left.left, self._node(left.right, right))
+            return self._node(self._node(left.left, left.right.left), self._node(left.right.right, right))
+        if right.height > left.height + 1:
+            if right.right.height >= right.left.height:
+                return self._node(self._node(left, right.left), right.right)
+            return self._node(self._node(left, right.left.left), self._node(right.left.right, right.right))
+
+        return self._node(left, right)
+
+    def _insert(self, node, point):
+        if node is None:
+            return self._leaf(point)
+        if node.is_leaf:
+            if point.coords == node.data.coords:
+                return node
+            leaf = self._leaf(point)
+            return self._node(leaf, node) if point.coords < node.data.coords else self._node(node, leaf)
+
+        if point.coords <= node.data.coords:
+            left = self._insert(node.left, point)
+            return node if left is node.left else self._balanced(left, node.right)
+
+        right = self._insert(node.right, point)
+        return node if right is node.right else self._balanced(node.left, right)
+
+    def _delete(self, node, point):
+        if node is None:
+            return None
+        if node.is_leaf:
+            return None if point.coords == node.data.coords else node
+
+        if point.coords <= node.data.coords:
+            left = self._delete(node.left, point)
+            if left is node.left:
+                return node
+            return node.right if left is None else self._balanced(left, node.right)
+
+        right = self._delete(node.right, point)
+        if right is node.right:
+            return node
+        return node.left if right is None else self._balanced(node.left, right)
@@ -1,5 +1,6 @@
 from math import pi
-from .core import PyCGAObject, Point
+from .core import PyCGAObject, Point, as_points
+from .monotone_chain import monotone_chain_hull
 
 
 class GrahamStepsTableRow(PyCGAObject):
@@ -53,9 +54,14 @@ class GrahamStepsTable(PyCGAObject):
         return str(self)
 
 
-def graham(points):
+def graham(points, trace=True):
+    """Yield the steps of Graham's scan, or with trace=False, only the resulting hull."""
+    points = as_points(points)
+
     if len(points) < 3:
         yield sorted(points, key=lambda p: (p.y, -p.x))
+    elif not trace:
+        yield graham_hull(points)
     else:
         i = 2
         while Point.direction(points[0], points[1], points[i]) == 0:
@@ -83,6 +89,18 @@ def graham(points):
         yield hull
 
 
+def graham_hull(points):
+    """
+        The hull Graham's scan results in, delegated to the monotone chain, which sorts on raw coordinates
+        instead of polar angles: counterclockwise from the lowest (rightmost) point.
+    """
+    hull = monotone_chain_hull(points)
+    origin = min(hull, key=lambda p: (p.y, -p.x))
+    i = next(i for i, p in enumerate(hull) if p is origin)
+
+    return hull[i:] + hull[:i]
+
+
 def sort_points(points, centroid, origin):
     min_angle = Point.polar_angle(origin, centroid)
 
@@ -95,14 +113,16 @@ def sort_points(points, centroid, origin):
 
 
 def make_hull(steps_table, ordered_points):
+    """Scan the ordered points, recording the steps unless steps_table is None."""
     res = ordered_points[:2]
 
     for point in ordered_points[2:]:
         while len(res) > 1 and Point.direction(res[-2], res[-1], point) >= 0:
-            steps_table.append(GrahamStepsTableRow((res[-2], res[-1], point), False))
+            if steps_table is not None:
+                steps_table.append(GrahamStepsTableRow((res[-2], res[-1], point), False))
             res.pop()
 
-        if len(res) > 1:
+        if len(res) > 1 and steps_table is not None:
             steps_table.append(GrahamStepsTableRow((res[-2], res[-1], point), True))
         
         res.append(point)
@@ -0,0 +1,55 @@
+from .core import PyCGAObject, Point, as_points
+from .monotone_chain import monotone_chain_hull, merge_hulls
+
+
+class HullSummary(PyCGAObject):
+    """
+        Convex hull of a shard of points with the number of points it summarizes, mergeable in O(h1 + h2).
+
+        Summaries pickle as they are and convert to and from plain dicts of coordinates for JSON or sockets,
+        so workers can reduce their partial hulls with reduce.
+    """
+    def __init__(self, hull=(), count=0):
+        self.hull = list(hull)
+        self.count = count
+
+    @classmethod
+    def from_points(cls, points):
+        points = as_points(points)
+        return cls(monotone_chain_hull(points), len(points))
+
+    def merge(self, other):
+        return self.__class__(merge_hulls(self.hull, other.hull), self.count + other.count)
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    @classmethod
+    def reduce(cls, summaries, executor=None):
+        """Merge summaries pairwise in a balanced tree, each level in the concurrent.futures executor if one is given."""
+        summaries = list(summaries)
+        if not summaries:
+            return cls()
+
+        while len(summaries) > 1:
+            lefts, rights = summaries[0::2], summaries[1::2]
+            merged = list(executor.map(cls.merge, lefts, rights) if executor else map(cls.merge, lefts, rights))
+            summaries = merged + lefts[len(rights):]
+
+        return summaries[0]
+
+    def to_dict(self):
+        return {"hull": [list(p.coords) for p in self.hull], "count": self.count}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls((Point(*coords) for coords in data["hull"]), data["count"])
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.hull == other.hull and self.count == other.count
+
+    def __str__(self):
+        return f"HullSummary({self.hull}, {self.count})"
+
+    def __repr__(self):
+        return str(self)
@@ -1,11 +1,14 @@
-from .core import Point
+from .core import Point, PointArray, as_points
+from .predicates import ORIENTATION_ERROR_BOUND, orientation, robust_predicates_enabled
 
 
 def jarvis(points):
+    points = as_points(points)
+
     if len(points) < 3:
         return sorted(points)
     
-    index = points.index(min(points, key=lambda p: p.x))
+    index = min(range(len(points)), key=lambda i: points[i].coords)
     leftmost_index = index
     res = [points[index]]
     length = len(points)
@@ -27,6 +30,54 @@ def jarvis(points):
     return res
 
 
+def jarvis_array(points):
+    """
+        Jarvis' march over the flat coordinate buffers of a PointArray: each wrap step is one pass over the raw floats
+        with the orientation and the distance tie-break of direction_correct inlined, instead of building Vectors per candidate.
+        Returns the same hull as jarvis, made of the given points.
+
+        With robust predicates enabled, an orientation whose sign the float error bound does not certify
+        is re-evaluated exactly by predicates.orientation.
+    """
+    array = PointArray.from_points(points)
+    length = len(array)
+
+    if length < 3:
+        return sorted(as_points(points))
+
+    # Unboxed once up front, since indexing an array('d') allocates a float object per access
+    xs, ys = array.xs.tolist(), array.ys.tolist()
+    indices = range(length)
+    index = min(indices, key=lambda i: (xs[i], ys[i]))
+    leftmost_index = index
+    res = [index]
+    robust = robust_predicates_enabled()
+
+    while True:
+        x0, y0 = xs[leftmost_index], ys[leftmost_index]
+        next_index = (leftmost_index + 1) % length
+        next_dx, next_dy = xs[next_index] - x0, ys[next_index] - y0
+
+        # The current point itself has zero offset, so it never replaces the candidate
+        for i, x, y in zip(indices, xs, ys):
+            direction_left, direction_right = next_dx * (y - y0), next_dy * (x - x0)
+            direction = direction_left - direction_right
+            if robust and abs(direction) <= ORIENTATION_ERROR_BOUND * (abs(direction_left) + abs(direction_right)):
+                direction = orientation(Point(x0, y0), Point(x, y), Point(xs[next_index], ys[next_index]))
+
+            if direction > 0 or direction == 0 and (x - x0)**2 + (y - y0)**2 > next_dx*next_dx + next_dy*next_dy:
+                next_index, next_dx, next_dy = i, x - x0, y - y0
+
+        leftmost_index = next_index
+
+        if leftmost_index == index:
+            break
+
+        res.append(next_index)
+
+    return [points[i] for i in res]
+
+
 def direction_correct(point1, point2, point3):
     direction = Point.direction(point1, point2, point3)
     return (
@@ -1,11 +1,17 @@
-from .core import BinTreeNode, BinTree
+from array import array
+from contextlib import contextmanager
+from heapq import heappush, heapreplace
+from math import hypot, inf
+from multiprocessing.shared_memory import SharedMemory
+from .core import PyCGAObject, BinTreeNode, BinTree, as_points
 
 
 class KDTree(BinTree):
-    def __init__(self, root, x_range, y_range):
+    def __init__(self, root, x_range, y_range, trace=True):
         super().__init__(root)
         self.x_range = x_range
         self.y_range = y_range
+        self.trace = trace
         self.partition = []
         self.search_list = []
 
@@ -13,7 +19,7 @@ class KDTree(BinTree):
         mid = len(points) // 2
         part = (points[mid], vertical)
         
-        if all(p[0] != part[0] for p in self.partition):
+        if self.trace and all(p[0] != part[0] for p in self.partition):
             self.partition.append(part)
 
         if mid == 0:
@@ -47,8 +53,9 @@ class KDTree(BinTree):
         if to_add:
             points.append(node.data)
 
-        intersection = left <= coord <= right        
-        self.search_list.append((node.data, to_add, intersection))
+        if self.trace:
+            intersection = left <= coord <= right
+            self.search_list.append((node.data, to_add, intersection))
 
         if node.left and left < coord:
             points.extend(self.region_search(node.left, not vertical))
@@ -66,7 +73,364 @@ class KDTree(BinTree):
         )
 
 
-def kd_tree(points, x_range, y_range):
+METRICS = {
+    "manhattan": lambda dx, dy: dx + dy,
+    "euclidean": hypot,
+    "chebyshev": max
+}
+
+
+def metric_function(metric):
+    """The function of the absolute coordinate differences giving the distance in the metric, as Point.dist measures it."""
+    try:
+        return METRICS[metric]
+    except KeyError:
+        raise ValueError(f'unknown metric "{metric}"')
+
+
+class FlatKDTree(PyCGAObject):
+    """
+        k-D tree stored in flat arrays. Every subtree takes a contiguous range of slots, and its root takes the
+        median slot of that range. Slot i holds the point points[index[i]] with coordinates xs[i] and ys[i],
+        the axis of its split (0 for x, 1 for y), the split value, and the slots of its children (-1 if absent).
+
+        The points are sorted by x and by y once, and both orders are partitioned stably around every median,
+        so building takes O(n log n).
+
+        Points may have weights. With summaries=True, every slot also stores the weight sum and the bounding box
+        of its subtree, so aggregate queries take a subtree lying in the query rectangle as a whole in O(1);
+        the number of points of a subtree is the length of its range of slots.
+    """
+    SHARED_ARRAYS = ("xs", "ys", "split", "index", "left", "right", "axis")
+
+    def __init__(self, points=(), weights=None, summaries=False):
+        self.points = as_points(points)
+        n = len(self.points)
+        if weights is not None and len(weights) != n:
+            raise ValueError("there must be one weight per point")
+
+        xs, ys = [p.x for p in self.points], [p.y for p in self.points]
+        # Stable sorts by the secondary coordinate first break ties lexicographically with plain float keys
+        by_x = sorted(sorted(range(n), key=ys.__getitem__), key=xs.__getitem__)
+        by_y = sorted(sorted(range(n), key=xs.__getitem__), key=ys.__getitem__)
+        ranks = [[0] * n, [0] * n]
+        for rank, (i, j) in enumerate(zip(by_x, by_y)):
+            ranks[0][i], ranks[1][j] = rank, rank
+
+        self.axis = axes = array("b", bytes(n))
+        self.split = splits = array("d", bytes(8 * n))
+        self.left = lefts = array("l", [-1]) * n
+        self.right = rights = array("l", [-1]) * n
+
+        stack, order = [(0, n, 0)] if n else [], []
+        while stack:
+            start, stop, axis = stack.pop()
+            mid = (start + stop) // 2
+            order.append(mid)
+            ordered, other, coords, rank = (by_x, by_y, xs, ranks[0]) if axis == 0 else (by_y, by_x, ys, ranks[1])
+            median = ordered[mid]
+            pivot = rank[median]
+
+            # Both orders keep the median in the middle slot, the lesser points before it and the greater ones after it
+            if stop - start > 3:
+                part = other[start:stop]
+                other[start:stop] = [i for i in part if rank[i] < pivot] + [median] + [i for i in part if rank[i] > pivot]
+            else:
+                other[start:stop] = ordered[start:stop]
+
+            axes[mid], splits[mid] = axis, coords[median]
+            if start < mid:
+                lefts[mid] = (start + mid) // 2
+                stack.append((start, mid, 1 - axis))
+            if mid + 1 < stop:
+                rights[mid] = (mid + 1 + stop) // 2
+                stack.append((mid + 1, stop, 1 - axis))
+
+        self.index = array("l", by_x)
+        self.xs = array("d", (xs[i] for i in by_x))
+        self.ys = array("d", (ys[i] for i in by_x))
+        self.bounds = (min(xs), max(xs), min(ys), max(ys)) if n else None
+        self.weights = array("d", (weights[i] for i in by_x)) if weights is not None else None
+
+        self.boxes = self.subtree_weights = None
+        if summaries:
+            self._summarize(reversed(order))
+
+    def _summarize(self, slots):
+        """Store the bounding boxes, as (x_min, x_max, y_min, y_max) at 4 * slot, and the weight sums of the subtrees of slots, children first."""
+        xs, ys, lefts, rights = self.xs, self.ys, self.left, self.right
+        self.boxes = boxes = array("d", bytes(32 * len(self)))
+        self.subtree_weights = weights = array("d", self.weights) if self.weights is not None else None
+
+        for slot in slots:
+            x_min = x_max = xs[slot]
+            y_min = y_max = ys[slot]
+            for child in (lefts[slot], rights[slot]):
+                if child != -1:
+                    i = 4 * child
+                    x_min, x_max = min(x_min, boxes[i]), max(x_max, boxes[i + 1])
+                    y_min, y_max = min(y_min, boxes[i + 2]), max(y_max, boxes[i + 3])
+                    if weights is not None:
+                        weights[slot] += weights[child]
+
+            boxes[4 * slot:4 * slot + 4] = array("d", (x_min, x_max, y_min, y_max))
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def root(self):
+        """Slot of the root, -1 if the tree is empty."""
+        return len(self) // 2 if len(self) else -1
+
+    def region_search(self, x_range, y_range):
+        """Yield the points lying in the closed rectangle x_range by y_range."""
+        points, index = self.points, self.index
+        for start, stop in self.region_slots(x_range, y_range):
+            for i in index[start:stop]:
+                yield points[i]
+
+    def region_indices(self, x_range, y_range):
+        """Yield the indices in points of the points lying in the closed rectangle x_range by y_range."""
+        index = self.index
+        for start, stop in self.region_slots(x_range, y_range):
+            yield from index[start:stop]
+
+    def region_slots(self, x_range, y_range):
+        """
+            Yield the ranges of slots, as (start, stop) pairs, of the points lying in the closed rectangle x_range by y_range.
+
+            The tree is walked with an explicit stack carrying the cell of every subtree, and a subtree whose cell lies
+            in the rectangle is reported as a whole without checking its points.
+        """
+        if not len(self):
+            return
+
+        (x_min, x_max), (y_min, y_max) = x_range, y_range
+        xs, ys, axes, splits, lefts, rights = self.xs, self.ys, self.axis, self.split, self.left, self.right
+        stack = [(self.root, 0, len(self), *self.bounds)]
+
+        while stack:
+            slot, start, stop, cell_x_min, cell_x_max, cell_y_min, cell_y_max = stack.pop()
+            if x_min <= cell_x_min and cell_x_max <= x_max and y_min <= cell_y_min and cell_y_max <= y_max:
+                yield start, stop
+                continue
+
+            if x_min <= xs[slot] <= x_max and y_min <= ys[slot] <= y_max:
+                yield slot, slot + 1
+
+            split, left, right = splits[slot], lefts[slot], rights[slot]
+            if axes[slot] == 0:
+                if right != -1 and split <= x_max:
+                    stack.append((right, slot + 1, stop, split, cell_x_max, cell_y_min, cell_y_max))
+                if left != -1 and x_min <= split:
+                    stack.append((left, start, slot, cell_x_min, split, cell_y_min, cell_y_max))
+            else:
+                if right != -1 and split <= y_max:
+                    stack.append((right, slot + 1, stop, cell_x_min, cell_x_max, split, cell_y_max))
+                if left != -1 and y_min <= split:
+                    stack.append((left, start, slot, cell_x_min, cell_x_max, cell_y_min, split))
+
+    def count_region(self, x_range, y_range):
+        """Number of points lying in the closed rectangle x_range by y_range, found in O(sqrt n) without visiting them."""
+        return sum(stop - start for start, stop in self.region_slots(x_range, y_range))
+
+    def region_summary(self, x_range, y_range):
+        """
+            The number of points lying in the closed rectangle x_range by y_range, the sum of their weights (their number
+            if the points have none), and their bounding box as (x_min, x_max, y_min, y_max), None if there are no points.
+
+            With summaries, a subtree lying in the rectangle takes O(1); otherwise its points are aggregated one by one.
+        """
+        count, weight = 0, 0
+        x_min = y_min = inf
+        x_max = y_max = -inf
+
+        for start, stop in self.region_slots(x_range, y_range):
+            if stop - start == 1:
+                range_weight = self.weights[start] if self.weights is not None else 1
+                box = self.xs[start], self.xs[start], self.ys[start], self.ys[start]
+            elif self.boxes is not None:
+                # A range of several slots is a whole subtree, rooted in its middle slot
+                slot = (start + stop) // 2
+                range_weight = self.subtree_weights[slot] if self.weights is not None else stop - start
+                box = self.boxes[4 * slot:4 * slot + 4]
+            else:
+                range_weight = sum(self.weights[start:stop]) if self.weights is not None else stop - start
+                box = min(self.xs[start:stop]), max(self.xs[start:stop]), min(self.ys[start:stop]), max(self.ys[start:stop])
+
+            count += stop - start
+            weight += range_weight
+            x_min, x_max = min(x_min, box[0]), max(x_max, box[1])
+            y_min, y_max = min(y_min, box[2]), max(y_max, box[3])
+
+        return count, weight, (x_min, x_max, y_min, y_max) if count else None
+
+    def nearest(self, point, k=1, metric="euclidean"):
+        """
+            The k points nearest to point in the metric, nearest first.
+
+            The k nearest points found so far are kept in a bounded max-heap, and subtrees whose cells lie farther away
+            than the k-th of them are skipped; the nearer child of a node is visited first.
+        """
+        if k <= 0 or not len(self):
+            return []
+
+        distance, x, y = metric_function(metric), point.x, point.y
+        xs, ys = self.xs, self.ys
+        heap = []  # (-distance, -slot) of the nearest points found so far
+        stack = [(0, self.root, 0, len(self), self.bounds)]
+
+        while stack:
+            cell_distance, slot, start, stop, cell = stack.pop()
+            if len(heap) == k and cell_distance >= -heap[0][0]:
+                continue
+
+            d = distance(abs(xs[slot] - x), abs(ys[slot] - y))
+            if len(heap) < k:
+                heappush(heap, (-d, -slot))
+            elif d < -heap[0][0]:
+                heapreplace(heap, (-d, -slot))
+
+            children = [(self._cell_distance(distance, x, y, child[3]), *child) for child in self._children(slot, start, stop, cell)]
+            stack.extend(sorted(children, key=lambda child: -child[0]))
+
+        return [self.points[self.index[-slot]] for _, slot in sorted(heap, reverse=True)]
+
+    def within_radius(self, point, radius, metric="euclidean"):
+        """Yield the points at distance at most radius from point in the metric; subtrees whose cells lie within it are reported whole."""
+        if not len(self):
+            return
+
+        distance, x, y = metric_function(metric), point.x, point.y
+        points, index, xs, ys = self.points, self.index, self.xs, self.ys
+        stack = [(self.root, 0, len(self), self.bounds)]
+
+        while stack:
+            slot, start, stop, cell = stack.pop()
+            if self._cell_distance(distance, x, y, cell) > radius:
+                continue
+
+            x_min, x_max, y_min, y_max = cell
+            if distance(max(x - x_min, x_max - x), max(y - y_min, y_max - y)) <= radius:
+                for i in index[start:stop]:
+                    yield points[i]
+                continue
+
+            if distance(abs(xs[slot] - x), abs(ys[slot] - y)) <= radius:
+                yield points[index[slot]]
+
+            stack.extend(self._children(slot, start, stop, cell))
+
+    def query_many(self, rectangles, executor=None, chunk_size=1024):
+        """
+            Answer a batch of (x_range, y_range) rectangle queries in the CSR layout: the indices in points of the points
+            found by the i-th query are indices[offsets[i]:offsets[i + 1]].
+
+            If a concurrent.futures executor is given, the queries are answered in chunks of chunk_size in it.
+            The flat arrays of the tree are copied once into a shared memory buffer, which the tasks attach to by name,
+            so only the rectangles and the resulting indices are sent between processes.
+        """
+        rectangles = list(rectangles)
+        if executor is None:
+            counts, indices = self._query_chunk(rectangles)
+        else:
+            counts, indices = array("l"), array("l")
+            memory, layout = self._share()
+            try:
+                chunks = [rectangles[i:i+chunk_size] for i in range(0, len(rectangles), chunk_size)]
+                tasks = ((memory.name, layout, self.bounds, chunk) for chunk in chunks)
+                for chunk_counts, chunk_indices in executor.map(_query_chunk, *zip(*tasks)):
+                    counts.extend(chunk_counts)
+                    indices.extend(chunk_indices)
+            finally:
+                memory.close()
+                memory.unlink()
+
+        offsets = array("l", [0])
+        for count in counts:
+            offsets.append(offsets[-1] + count)
+
+        return offsets, indices
+
+    def _query_chunk(self, rectangles):
+        """The number of points found by each of the rectangle queries, and their indices one query after another."""
+        counts, indices = array("l"), array("l")
+        for x_range, y_range in rectangles:
+            size = len(indices)
+            indices.extend(self.region_indices(x_range, y_range))
+            counts.append(len(indices) - size)
+
+        return counts, indices
+
+    def _share(self):
+        """A shared memory buffer holding the flat arrays of the tree, and their (name, typecode, offset, length) layout."""
+        # Wider items first, so that every array is aligned to its item size
+        columns = sorted(self.SHARED_ARRAYS, key=lambda name: -getattr(self, name).itemsize)
+        layout, offset = [], 0
+        for name in columns:
+            column = getattr(self, name)
+            layout.append((name, column.typecode, offset, len(column)))
+            offset += len(column) * column.itemsize
+
+        memory = SharedMemory(create=True, size=max(offset, 1))
+        for name, _, start, _ in layout:
+            data = getattr(self, name).tobytes()
+            memory.buf[start:start + len(data)] = data
+
+        return memory, layout
+
+    def _children(self, slot, start, stop, cell):
+        """The (slot, start, stop, cell) entries of the children of the node in slot, whose subtree has the cell."""
+        x_min, x_max, y_min, y_max = cell
+        split, res = self.split[slot], []
+        if self.left[slot] != -1:
+            res.append((self.left[slot], start, slot, (x_min, split, y_min, y_max) if self.axis[slot] == 0 else (x_min, x_max, y_min, split)))
+        if self.right[slot] != -1:
+            res.append((self.right[slot], slot + 1, stop, (split, x_max, y_min, y_max) if self.axis[slot] == 0 else (x_min, x_max, split, y_max)))
+
+        return res
+
+    @staticmethod
+    def _cell_distance(distance, x, y, cell):
+        x_min, x_max, y_min, y_max = cell
+        return distance(max(x_min - x, 0, x - x_max), max(y_min - y, 0, y - y_max))
+
+
+@contextmanager
+def _shared_kd_tree(name, layout, bounds):
+    """A FlatKDTree without points whose arrays are views of the shared memory buffer with the given name."""
+    memory = SharedMemory(name=name)
+    tree = FlatKDTree.__new__(FlatKDTree)
+    tree.points, tree.bounds = None, bounds
+
+    views = []
+    for column, typecode, offset, length in layout:
+        view = memory.buf[offset:offset + length * array(typecode).itemsize]
+        views.extend((view, view.cast(typecode)))
+        setattr(tree, column, views[-1])
+
+    try:
+        yield tree
+    finally:
+        for view in reversed(views):
+            view.release()
+        memory.close()
+
+
+def _query_chunk(name, layout, bounds, rectangles):
+    with _shared_kd_tree(name, layout, bounds) as tree:
+        return tree._query_chunk(rectangles)
+
+
+def kd_tree(points, x_range, y_range, trace=True):
+    """Yield the steps of the k-D tree region search, or with trace=False, only the points found."""
+    points = as_points(points)
+
+    if not trace:
+        yield list(FlatKDTree(points).region_search(x_range, y_range))
+        return
+
     ordered_x = sorted(points)
     ordered_y = sorted(points, key=lambda p: (p.y, p.x))
     yield ordered_x, ordered_y
@@ -0,0 +1,64 @@
+import heapq
+from .core import Point, as_points
+
+
+def monotone_chain(points, presorted=False):
+    """
+        Lower and upper chains of the convex hull by Andrew's monotone chain, both from the lexicographically
+        smallest point to the largest one, strictly convex. The points are sorted by their raw coordinates,
+        or taken as they are in O(n) if presorted.
+    """
+    points = as_points(points)
+    if not presorted:
+        points = sorted(points, key=lambda p: (p.x, p.y))
+
+    return half_chain(points, 1), half_chain(points, -1)
+
+
+def half_chain(points, sign):
+    """The lower (sign 1) or the upper (sign -1) chain of lexicographically sorted points."""
+    res = []
+    for point in points:
+        if res and point.x == res[-1].x and point.y == res[-1].y:
+            continue
+
+        while len(res) > 1 and sign * Point.direction(res[-2], res[-1], point) >= 0:
+            res.pop()
+
+        res.append(point)
+
+    return res
+
+
+def monotone_chain_hull(points, presorted=False):
+    """Counterclockwise strictly convex hull from the lexicographically smallest point."""
+    lower, upper = monotone_chain(points, presorted)
+    if len(lower) < 2:
+        return lower
+
+    return lower[:-1] + upper[:0:-1]
+
+
+def split_chains(hull):
+    """Lower and upper chains of a counterclockwise hull from its lexicographically smallest vertex, as monotone_chain returns them."""
+    if not hull:
+        return [], []
+
+    i = max(range(len(hull)), key=lambda i: hull[i].coords)
+    return hull[:i+1], hull[:1] + hull[:i-1:-1]
+
+
+def merge_hulls(hull1, hull2):
+    """
+        Hull of the union of two counterclockwise hulls from their lexicographically smallest vertices in O(h1 + h2):
+        their lower and upper chains are merged in lexicographic order and scanned again as presorted input.
+    """
+    (lower1, upper1), (lower2, upper2) = split_chains(hull1), split_chains(hull2)
+    key = lambda p: p.coords
+    lower = half_chain(list(heapq.merge(lower1, lower2, key=key)), 1)
+    upper = half_chain(list(heapq.merge(upper1, upper2, key=key)), -1)
+
+    if len(lower) < 2:
+        return lower
+
+    return lower[:-1] + upper[:0:-1]
@@ -0,0 +1,126 @@
+from contextlib import contextmanager
+from fractions import Fraction
+from math import copysign, ulp
+from sys import float_info
+from .core import PyCGAObject, Point
+
+
+EPSILON = float_info.epsilon / 2
+ORIENTATION_ERROR_BOUND = (3 + 16 * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10 + 96 * EPSILON) * EPSILON
+
+
+class PredicateStats(PyCGAObject):
+    """Counters of robust predicate evaluations and of those that fell back to exact arithmetic."""
+    def __init__(self):
+        self.calls = 0
+        self.exact_calls = 0
+
+    @property
+    def exact_ratio(self):
+        return self.exact_calls / self.calls if self.calls else 0.0
+
+    def reset(self):
+        self.calls = 0
+        self.exact_calls = 0
+
+    def __str__(self):
+        return f"{self.exact_calls}/{self.calls} exact"
+
+    def __repr__(self):
+        return str(self)
+
+
+stats = PredicateStats()
+
+
+def orientation(point1, point2, point3):
+    """
+        Robust counterpart of Point.direction: the cross product of vectors point1->point3 and point1->point2.
+
+        The floating-point result is returned whenever its sign is certified by an error bound;
+        otherwise the determinant is re-evaluated exactly with rational arithmetic.
+    """
+    stats.calls += 1
+    x1, y1 = point1.x, point1.y
+    x2, y2, x3, y3 = point2.x, point2.y, point3.x, point3.y
+
+    det_left = (x3 - x1) * (y2 - y1)
+    det_right = (y3 - y1) * (x2 - x1)
+    det = det_left - det_right
+
+    if abs(det) > ORIENTATION_ERROR_BOUND * (abs(det_left) + abs(det_right)):
+        return det
+
+    stats.exact_calls += 1
+    x1, y1 = Fraction(x1), Fraction(y1)
+    exact = (Fraction(x3) - x1) * (Fraction(y2) - y1) - (Fraction(y3) - y1) * (Fraction(x2) - x1)
+
+    return _to_float(exact)
+
+
+def incircle(point1, point2, point3, point4):
+    """
+        Positive if point4 lies inside the circle through point1, point2, point3 (given counterclockwise),
+        negative if outside and zero if the four points are cocircular.
+    """
+    stats.calls += 1
+    adx, ady = point1.x - point4.x, point1.y - point4.y
+    bdx, bdy = point2.x - point4.x, point2.y - point4.y
+    cdx, cdy = point3.x - point4.x, point3.y - point4.y
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift, blift, clift = adx * adx + ady * ady, bdx * bdx + bdy * bdy, cdx * cdx + cdy * cdy
+
+    det = alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift * (adxbdy - bdxady)
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+
+    if abs(det) > INCIRCLE_ERROR_BOUND * permanent:
+        return det
+
+    stats.exact_calls += 1
+    x4, y4 = Fraction(point4.x), Fraction(point4.y)
+    adx, ady = Fraction(point1.x) - x4, Fraction(point1.y) - y4
+    bdx, bdy = Fraction(point2.x) - x4, Fraction(point2.y) - y4
+    cdx, cdy = Fraction(point3.x) - x4, Fraction(point3.y) - y4
+    exact = (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+    return _to_float(exact)
+
+
+def _to_float(value):
+    """Convert an exact value to float without letting a nonzero value underflow to zero."""
+    res = float(value)
+    return copysign(ulp(0.0), value) if res == 0 and value != 0 else res
+
+
+_float_direction = Point.__dict__["direction"]
+
+
+def use_robust_predicates(enabled=True):
+    """Switch Point.direction, and thus every algorithm of the library, between robust and plain float orientation."""
+    Point.direction = staticmethod(orientation) if enabled else _float_direction
+
+
+def robust_predicates_enabled():
+    return Point.__dict__["direction"] is not _float_direction
+
+
+@contextmanager
+def robust_predicates(enabled=True):
+    previous = robust_predicates_enabled()
+    use_robust_predicates(enabled)
+    try:
+        yield stats
+    finally:
+        use_robust_predicates(previous)
@@ -1,4 +1,4 @@
-from .core import Point, ThreadedBinTreeNode, ThreadedBinTree, PointType, PathDirection
+from .core import PyCGAObject, Point, ThreadedBinTreeNode, ThreadedBinTree, PointType, PathDirection, as_points
 
 
 class PreparataNode(ThreadedBinTreeNode):
@@ -19,11 +19,101 @@ class PreparataThreadedBinTree(ThreadedBinTree):
     node_class = PreparataNode
 
 
-def preparata(points):
+class PreparataHull(PyCGAObject):
+    """
+        Online convex hull: add(point) takes O(log n) amortized, contains(point) O(log n) and hull() O(h).
+
+        The upper and the lower chains are kept in non-circular threaded AVL trees ordered lexicographically.
+        A new vertex is inserted into each chain it lies outside of, then the vertices it makes non-convex are deleted
+        one by one from both sides; every point is deleted at most once.
+    """
+    def __init__(self, points=()):
+        self.upper = PreparataThreadedBinTree(None)
+        self.lower = PreparataThreadedBinTree(None)
+        self.upper.circular = self.lower.circular = False
+
+        for point in points:
+            self.add(point)
+
+    def add(self, point):
+        """Add a point; returns whether it became a vertex of the hull."""
+        in_upper = self._add_to_chain(self.upper, point, -1)
+        in_lower = self._add_to_chain(self.lower, point, 1)
+        return in_upper or in_lower
+
+    def contains(self, point):
+        """Whether the point lies inside the hull or on its boundary."""
+        return self._is_covered(self.upper, point, -1) and self._is_covered(self.lower, point, 1)
+
+    def hull(self):
+        """The hull clockwise from the leftmost point, as preparata yields it."""
+        upper = [node.point for node in self.upper.iter_inorder()]
+        lower = [node.point for node in self.lower.iter_inorder()]
+        return upper + lower[-2:0:-1]
+
+    @staticmethod
+    def _find(tree, point):
+        """The nodes of the greatest point less than point, of point itself, and of the least point greater than point."""
+        lower = upper = None
+        node, key = tree.root, point.coords
+        while node:
+            coords = node.data.coords
+            if key < coords:
+                upper, node = node, node.left
+            elif key > coords:
+                lower, node = node, node.right
+            else:
+                return tree.predecessor(node), node, tree.successor(node)
+
+        return lower, None, upper
+
+    @classmethod
+    def _is_covered(cls, tree, point, sign):
+        """Whether the point is a vertex of the chain or lies on the inner side of it; the lower chain has sign 1, the upper -1."""
+        lower, equal, upper = cls._find(tree, point)
+        return (
+            equal is not None or
+            lower is not None and upper is not None and sign * Point.direction(lower.point, point, upper.point) >= 0
+        )
+
+    @classmethod
+    def _add_to_chain(cls, tree, point, sign):
+        if cls._is_covered(tree, point, sign):
+            return False
+
+        tree.insert(point)
+
+        # Deletion may move data between nodes, so the node of the new point is looked up again every time
+        while True:
+            lower, _, _ = cls._find(tree, point)
+            if lower is None or tree.predecessor(lower) is None:
+                break
+            if sign * Point.direction(tree.predecessor(lower).point, lower.point, point) < 0:
+                break
+
+            tree.delete(lower.point)
+
+        while True:
+            _, _, upper = cls._find(tree, point)
+            if upper is None or tree.successor(upper) is None:
+                break
+            if sign * Point.direction(point, upper.point, tree.successor(upper).point) < 0:
+                break
+
+            tree.delete(upper.point)
+
+        return True
+
+
+def preparata(points, trace=True):
+    """Yield the steps of Preparata's algorithm, or with trace=False, only the resulting hull."""
+    points = as_points(points)
     points.sort()
 
     if len(points) < 3:
         yield points
+    elif not trace:
+        yield PreparataHull(points).hull()
     else:
         # Find first three non-collinear points
         i = 2
@@ -55,9 +145,8 @@ def preparata(points):
             left_i = hull.index(left_supporting_point)
             right_i = hull.index(right_supporting_point)
             
-            # Drop the points from exclusive range (right, left) and insert the new point between right and left.
             deleted_points.append(hull[right_i+1:] if left_i < right_i else hull[right_i+1:left_i])
-            hull = hull[:right_i+1] + [point] + ([] if left_i < right_i else hull[left_i:])
+            hull = insert_between(hull, point, left_i, right_i)
             hulls.append(hull)
         
         yield hulls[0], trees[0]
@@ -67,6 +156,11 @@ def preparata(points):
         yield hull
 
 
+def insert_between(hull, point, left_i, right_i):
+    """Drop the points from exclusive range (right_i, left_i) of hull indices and insert the new point between right and left."""
+    return hull[:right_i+1] + [point] + ([] if left_i < right_i else hull[left_i:])
+
+
 def find_path_to_supporting_point(tree, point, search_left_supporting):
     path = []
     node, prev = tree.root, None
@@ -1,4 +1,8 @@
-from .core import Line2D, BinTreeNode, BinTree, Point
+from array import array as array_
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from .core import BinTreeNode, BinTree, Point, PointArray, as_points
+from .predicates import orientation, robust_predicates_enabled
 
 
 sort_left_to_right = lambda p: (p.x, -p.y)
@@ -35,9 +39,19 @@ class QuickhullTree(BinTree):
     node_class = QuickhullNode
 
 
-def quickhull(points):
-    leftmost_point = min(points, key=lambda p: p.coords)
-    rightmost_point = max(points, key=lambda p: p.coords)
+def quickhull(points, trace=True, executor=None):
+    """
+        Yield the steps of Quickhull, or with trace=False, only the resulting hull, computed in the executor
+        if one is given (see quickhull_hull).
+    """
+    points = as_points(points)
+
+    leftmost_point = min(points, key=lambda p: (p.x, p.y))
+    rightmost_point = max(points, key=lambda p: (p.x, p.y))
+
+    if not trace:
+        yield quickhull_hull(points, executor)
+        return
 
     subset1 = make_subset(points, leftmost_point, rightmost_point, sort_key=sort_left_to_right)
     subset2 = make_subset(points, rightmost_point, leftmost_point, sort_key=sort_right_to_left)
@@ -60,24 +74,276 @@ def quickhull(points):
     yield hull
 
 
-def partition(points, left, right, node):
+def partition(points, left, right, node=None):
+    """Subhull of points from left to right, recording the partition tree under node unless it is None."""
     if len(points) == 2:
+        if node is None:
+            return [left, right]
+
         node.subhull = [left, right]
         return node.subhull
 
-    lr_line = Line2D(left, right)
-    pts = filter(lambda p: p != left and p != right, points)
-
-    h = max(pts, key=lambda p: (Point.dist(p, lr_line), Point.angle(left, p, right)))
+    h = farthest_point([p for p in points if p is not left and p is not right], left, right)
     s1 = left_points(points, left, h)
     s2 = left_points(points, h, right)
 
+    if node is None:
+        return partition(s1, left, h) + partition(s2, h, right)[1:]
+
     node.h, node.left, node.right = h, QuickhullNode(s1), QuickhullNode(s2)
     node.subhull = partition(s1, left, h, node.left) + partition(s2, h, right, node.right)[1:]
     
     return node.subhull
 
 
+def farthest_point(points, left, right):
+    """
+        The point farthest from the line left-right, breaking ties by the widest angle left-p-right, which on a line
+        parallel to left-right is the one whose projection is closest to the middle of the segment.
+    """
+    x1, y1 = left.x, left.y
+    dx, dy = right.x - x1, right.y - y1
+    mx, my = x1 + dx / 2, y1 + dy / 2
+
+    return max(points, key=lambda p: (abs((p.x-x1)*dy - (p.y-y1)*dx), -abs((p.x-mx)*dx + (p.y-my)*dy)))
+
+
+def quickhull_hull(points, executor=None, threshold=100000):
+    """
+        Convex hull by Quickhull without building the partition tree: clockwise from the leftmost point, like the one of quickhull.
+
+        Points strictly inside the Akl-Toussaint octagon of the extreme points in x, y, x+y and x-y are discarded first,
+        and the subsets are then partitioned with an explicit stack, computing signed areas over flat coordinate lists.
+
+        If a concurrent.futures executor is given and there are more than threshold points, the work is done in it
+        by parallel_quickhull_hull. With robust predicates enabled, every orientation goes through predicates.orientation.
+    """
+    if executor is not None and len(points) > threshold:
+        return parallel_quickhull_hull(points, executor, threshold)
+
+    points = as_points(points)
+    xs, ys = [p.x for p in points], [p.y for p in points]
+    indices = range(len(points))
+    robust = robust_predicates_enabled()
+
+    leftmost = min(indices, key=lambda i: (xs[i], ys[i]))
+    rightmost = max(indices, key=lambda i: (xs[i], ys[i]))
+    candidates = octagon_filter(xs, ys, indices, robust)
+
+    upper = _chain(xs, ys, _left_of(xs, ys, candidates, leftmost, rightmost, robust), leftmost, rightmost, 1, robust)
+    lower = _chain(xs, ys, _left_of(xs, ys, candidates, rightmost, leftmost, robust), rightmost, leftmost, -1, robust)
+
+    return [points[i] for i in upper + lower[1:-1]]
+
+
+def parallel_quickhull_hull(points, executor, threshold=100000):
+    """
+        quickhull_hull with the work spread over a concurrent.futures executor, usually a ProcessPoolExecutor.
+
+        The coordinates are copied once into a shared memory buffer which the tasks attach to by name, so only indices
+        are sent between processes. The extremes and the octagon filter are computed over chunks of threshold points,
+        then the upper and lower subsets are split at their farthest points until no subproblem has more than
+        threshold points, and the subproblems are solved independently.
+    """
+    array = PointArray.from_points(points)
+    n = len(array)
+    # Worker processes do not share the predicates switch, so its state is passed to every task
+    robust = robust_predicates_enabled()
+
+    memory = SharedMemory(create=True, size=max(len(array.coords), 1) * array.coords.itemsize)
+    try:
+        memory.buf[:len(array.coords) * array.coords.itemsize] = array.coords.tobytes()
+        name = memory.name
+        chunks = [(start, min(start + threshold, n)) for start in range(0, n, threshold)]
+
+        with _shared_coords(name) as (xs, ys):
+            extremes = list(executor.map(_chunk_extremes, *zip(*((name, *chunk) for chunk in chunks))))
+            keys = _octagon_keys(xs, ys)
+            octagon = _octagon(xs, ys, [min((e[j] for e in extremes), key=key) for j, key in enumerate(keys)])
+            leftmost = min((e[-2] for e in extremes), key=lambda i: (xs[i], ys[i]))
+            rightmost = max((e[-1] for e in extremes), key=lambda i: (xs[i], ys[i]))
+
+            candidates = list(executor.map(
+                _chunk_candidates,
+                *zip(*((name, *chunk, octagon, leftmost, rightmost, robust) for chunk in chunks))
+            ))
+            upper = array_("q", (i for c in candidates for i in c[0]))
+            lower = array_("q", (i for c in candidates for i in c[1]))
+
+            subproblems = [(leftmost, rightmost, upper, 1), (rightmost, leftmost, lower, -1)]
+            while any(len(indices) > threshold for _, _, indices, _ in subproblems):
+                large = [s for s in subproblems if len(s[2]) > threshold]
+                splits = iter(executor.map(_split, *zip(*((name, *s, robust) for s in large))))
+
+                res = []
+                for left, right, indices, sign in subproblems:
+                    if len(indices) > threshold:
+                        h, s1, s2 = next(splits)
+                        res.extend(((left, h, s1, sign), (h, right, s2, sign)))
+                    else:
+                        res.append((left, right, indices, sign))
+
+                subproblems = res
+
+            chains = executor.map(_solve, *zip(*((name, *s, robust) for s in subproblems)))
+
+            hull = []
+            for chain in chains:
+                hull.extend(chain[:-1])
+
+        return [points[i] for i in hull]
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@contextmanager
+def _shared_coords(name):
+    """Views of the x and y coordinates of the shared memory buffer with the given name."""
+    memory = SharedMemory(name=name)
+    coords = memory.buf.cast("d")
+    xs, ys = coords[0::2], coords[1::2]
+    try:
+        yield xs, ys
+    finally:
+        xs.release()
+        ys.release()
+        coords.release()
+        memory.close()
+
+
+def _chunk_extremes(name, start, stop):
+    """Indices of the octagon extremes, then of the leftmost and the rightmost point, among the points of a chunk."""
+    with _shared_coords(name) as (xs, ys):
+        indices = range(start, stop)
+        return (
+            [min(indices, key=key) for key in _octagon_keys(xs, ys)] +
+            [min(indices, key=lambda i: (xs[i], ys[i])), max(indices, key=lambda i: (xs[i], ys[i]))]
+        )
+
+
+def _chunk_candidates(name, start, stop, octagon, leftmost, rightmost, robust=False):
+    """Indices of the points of a chunk outside the octagon, at the left of leftmost->rightmost and of rightmost->leftmost."""
+    with _shared_coords(name) as (xs, ys):
+        candidates = _outside(xs, ys, range(start, stop), octagon, robust)
+        return (
+            array_("q", _left_of(xs, ys, candidates, leftmost, rightmost, robust)),
+            array_("q", _left_of(xs, ys, candidates, rightmost, leftmost, robust)),
+        )
+
+
+def _split(name, left, right, indices, sign, robust=False):
+    """The farthest point of a subproblem and the indices at the left of left->h and of h->right."""
+    with _shared_coords(name) as (xs, ys):
+        h = _farthest(xs, ys, indices, left, right, sign, robust)
+        return (
+            h,
+            array_("q", _left_of(xs, ys, indices, left, h, robust)),
+            array_("q", _left_of(xs, ys, indices, h, right, robust)),
+        )
+
+
+def _solve(name, left, right, indices, sign, robust=False):
+    with _shared_coords(name) as (xs, ys):
+        return _chain(xs, ys, indices, left, right, sign, robust)
+
+
+def octagon_filter(xs, ys, indices, robust=False):
+    """Indices of the points not strictly inside the octagon of the extreme points in x, y, x+y and x-y."""
+    octagon = _octagon(xs, ys, [min(indices, key=key) for key in _octagon_keys(xs, ys)])
+    return _outside(xs, ys, indices, octagon, robust)
+
+
+def _octagon_keys(xs, ys):
+    """Keys minimized by the extremes in x, y, x+y and x-y, in counterclockwise order from the leftmost one."""
+    return (
+        lambda i: xs[i], lambda i: xs[i] + ys[i], lambda i: ys[i], lambda i: ys[i] - xs[i],
+        lambda i: -xs[i], lambda i: -xs[i] - ys[i], lambda i: -ys[i], lambda i: xs[i] - ys[i],
+    )
+
+
+def _octagon(xs, ys, extremes):
+    """The extremes in counterclockwise order without repetitions."""
+    octagon = []
+    for i in extremes:
+        if not octagon or (xs[i], ys[i]) != (xs[octagon[-1]], ys[octagon[-1]]):
+            octagon.append(i)
+
+    while len(octagon) > 1 and (xs[octagon[0]], ys[octagon[0]]) == (xs[octagon[-1]], ys[octagon[-1]]):
+        octagon.pop()
+
+    return octagon
+
+
+def _outside(xs, ys, indices, octagon, robust=False):
+    """Indices of the points not strictly inside the octagon."""
+    if len(octagon) < 3:
+        return list(indices)
+
+    inner = indices
+    for a, b in zip(octagon, octagon[1:] + octagon[:1]):
+        inner = _left_of(xs, ys, inner, a, b, robust)
+
+    inner = set(inner)
+    return [i for i in indices if i not in inner]
+
+
+def _left_of(xs, ys, indices, a, b, robust=False):
+    """Indices of the points strictly at the left of the vector a->b, as in left_points; see quickhull_hull for robust."""
+    if robust:
+        point_a, point_b = Point(xs[a], ys[a]), Point(xs[b], ys[b])
+        return [i for i in indices if orientation(point_a, Point(xs[i], ys[i]), point_b) > 0]
+
+    x1, y1 = xs[a], ys[a]
+    dx, dy = xs[b] - x1, ys[b] - y1
+    return [i for i in indices if (xs[i]-x1)*dy - (ys[i]-y1)*dx < 0]
+
+
+def _farthest(xs, ys, indices, left, right, sign, robust=False):
+    """
+        The point farthest from the line left-right, with the tie-breaks of farthest_point, then the order of the subsets
+        of quickhull, sorted left to right (sign 1) or right to left (sign -1).
+    """
+    # All the points are at the left, so the farthest has the most negative signed area
+    x1, y1 = xs[left], ys[left]
+    dx, dy = xs[right] - x1, ys[right] - y1
+    mx, my = x1 + dx / 2, y1 + dy / 2
+
+    if robust:
+        point_left, point_right = Point(x1, y1), Point(xs[right], ys[right])
+        return max(indices, key=lambda i: (
+            orientation(point_left, Point(xs[i], ys[i]), point_right),
+            -abs((xs[i]-mx)*dx + (ys[i]-my)*dy),
+            -sign * xs[i],
+            sign * ys[i],
+        ))
+
+    return max(indices, key=lambda i: (
+        (ys[i]-y1)*dx - (xs[i]-x1)*dy,
+        -abs((xs[i]-mx)*dx + (ys[i]-my)*dy),
+        -sign * xs[i],
+        sign * ys[i],
+    ))
+
+
+def _chain(xs, ys, indices, left, right, sign, robust=False):
+    """Subhull from left to right of the points strictly at the left of left->right, partitioned with an explicit stack."""
+    res = []
+    stack = [(right, None, None), (left, right, indices)]
+
+    while stack:
+        left, right, indices = stack.pop()
+        if not indices:
+            res.append(left)
+            continue
+
+        h = _farthest(xs, ys, indices, left, right, sign, robust)
+        stack.append((h, right, _left_of(xs, ys, indices, h, right, robust)))
+        stack.append((left, h, _left_of(xs, ys, indices, left, h, robust)))
+
+    return res
+
+
 def make_subset(points, left, right, sort_key):
     return sorted(left_points(points, left, right), key=sort_key)
 
@@ -0,0 +1,60 @@
+from itertools import islice
+from .core import PyCGAObject
+from .graham import graham_hull
+from .preparata import PreparataHull
+
+
+class StreamingHull(PyCGAObject):
+    """
+        Convex hull of a stream of points fed in chunks, keeping only the current hull vertices in memory.
+
+        The hull of each chunk is found by Graham's scan, and its vertices are added to an online Preparata hull,
+        so the memory used is O(h + chunk_size).
+    """
+    def __init__(self, chunk_size=1024):
+        self.chunk_size = chunk_size
+        self._hull = PreparataHull()
+
+    def add_chunk(self, points):
+        points = list(points)
+        for point in graham_hull(points) if len(points) > 2 else points:
+            self._hull.add(point)
+
+    def snapshot(self):
+        """The current hull, clockwise from the leftmost point."""
+        return self._hull.hull()
+
+    def contains(self, point):
+        return self._hull.contains(point)
+
+    def consume(self, points):
+        """Feed an iterable of points chunk by chunk, yielding a snapshot after every chunk."""
+        iterator = iter(points)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            self.add_chunk(chunk)
+            yield self.snapshot()
+
+    async def aconsume(self, points):
+        """Feed an async iterable of points chunk by chunk, yielding a snapshot after every chunk."""
+        chunk = []
+        async for point in points:
+            chunk.append(point)
+            if len(chunk) == self.chunk_size:
+                self.add_chunk(chunk)
+                chunk = []
+                yield self.snapshot()
+
+        if chunk:
+            self.add_chunk(chunk)
+            yield self.snapshot()
+
+
+def streaming_hull(points, chunk_size=1024):
+    """Yield the hull of the points consumed so far after every chunk of an iterable."""
+    yield from StreamingHull(chunk_size).consume(points)
+
+
+async def async_streaming_hull(points, chunk_size=1024):
+    """Yield the hull of the points consumed so far after every chunk of an async iterable."""
+    async for hull in StreamingHull(chunk_size).aconsume(points):
+        yield hull
@@ -0,0 +1,48 @@
+"""
+Command line entry point of the benchmark suite.
+
+    python -m benchmarks --sizes 100 1000 10000 --output results.json
+    python -m benchmarks --sizes 100 1000 10000 --compare results.json --tolerance 0.25
+
+With --compare, the process exits with status 1 if any regression against the baseline report is found.
+"""
+import argparse
+import sys
+from .distributions import DISTRIBUTIONS
+from .suite import ALGORITHMS, SIZES, run_suite, save_report, load_report, compare_reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark PyCompGeomAlgorithms.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=None)
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS), default=None)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per measurement")
+    parser.add_argument("--output", help="path to save the JSON report to")
+    parser.add_argument("--compare", help="path of a baseline JSON report to check for regressions against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown ratio before a regression is reported")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.algorithms, args.distributions, args.sizes, args.repeat, args.seed, args.timeout, log_progress=print)
+
+    for scaling in report["scaling"]:
+        exponent = scaling["exponent"]
+        print(f"{scaling['algorithm']:>18} {scaling['distribution']:>14} scaling exponent {'n/a' if exponent is None else f'{exponent:.2f}'}")
+
+    if args.output:
+        save_report(report, args.output)
+
+    if args.compare:
+        regressions = compare_reports(load_report(args.compare), report, args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['algorithm']} {r['distribution']} n={r['n']} {r['metric']}: {r['baseline']} -> {r['current']}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Standard point distributions for the benchmarks; every generator is seeded and returns a list of points."""
+import random
+from math import cos, sin, pi, sqrt
+from PyCompGeomAlgorithms.core import Point
+
+
+def uniform_square(n, seed=0):
+    rng = random.Random(seed)
+    return [Point(rng.random(), rng.random()) for _ in range(n)]
+
+
+def uniform_disk(n, seed=0):
+    rng = random.Random(seed)
+    points = []
+    for _ in range(n):
+        r, phi = sqrt(rng.random()), 2 * pi * rng.random()
+        points.append(Point(r * cos(phi), r * sin(phi)))
+
+    return points
+
+
+def circle(n, seed=0):
+    rng = random.Random(seed)
+    angles = [2 * pi * rng.random() for _ in range(n)]
+    return [Point(cos(phi), sin(phi)) for phi in angles]
+
+
+def gaussian(n, seed=0):
+    rng = random.Random(seed)
+    return [Point(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(n)]
+
+
+def clustered(n, seed=0, clusters=10, spread=0.02):
+    rng = random.Random(seed)
+    centers = [(rng.random(), rng.random()) for _ in range(clusters)]
+    points = []
+    for _ in range(n):
+        x, y = rng.choice(centers)
+        points.append(Point(rng.gauss(x, spread), rng.gauss(y, spread)))
+
+    return points
+
+
+DISTRIBUTIONS = {
+    "uniform_square": uniform_square,
+    "uniform_disk": uniform_disk,
+    "circle": circle,
+    "gaussian": gaussian,
+    "clustered": clustered,
+}
@@ -0,0 +1,79 @@
+"""Micro-benchmark of PointType.by_points on the preparata and dynamic hull paths.
+
+Run with ``python -m benchmarks.point_type`` from the repository root.
+"""
+import random
+from math import pi
+from timeit import timeit
+from PyCompGeomAlgorithms.core import Point, PointType
+from PyCompGeomAlgorithms.preparata import preparata
+from PyCompGeomAlgorithms.dynamic_hull import upper_dynamic_hull
+
+
+def trigonometric_by_points(source, target, left, right):
+    """The former atan2-based classification, kept as a reference for comparison."""
+    def polar_angle(point):
+        rot = Point.nonnegative_polar_angle(source, target)
+        angle = Point.nonnegative_polar_angle(point, target)
+        return angle - rot + (2 * pi if angle < rot else 0)
+
+    angles = polar_angle(left), polar_angle(right)
+    angle1, angle2 = min(angles), max(angles)
+    convex_or_reflex = 0 < angle1 <= pi <= angle2 < 2 * pi
+
+    if convex_or_reflex and angle2 < angle1 + pi:
+        return PointType.convex
+    if convex_or_reflex and angle2 > angle1 + pi:
+        return PointType.reflex
+    if 0 <= angle1 < angle2 < pi:
+        return PointType.left_supporting
+    if angle1 == 0:
+        angle1, angle2 = angle2, 2 * pi
+    if pi < angle1 < angle2 <= 2 * pi:
+        return PointType.right_supporting
+
+    raise ValueError
+
+
+DYNAMIC_HULL_POINTS = [
+    Point(3, 10), Point(6, 8), Point(3, 5), Point(2, 8), Point(4, 8), Point(5, 5),
+    Point(3, 3), Point(7, 7), Point(5, 0), Point(0, 0), Point(10, 3)
+]
+
+
+def random_quadruples(n, seed=0):
+    rng = random.Random(seed)
+    return [tuple(Point(rng.random(), rng.random()) for _ in range(4)) for _ in range(n)]
+
+
+def classify_all(classifier, quadruples):
+    for quadruple in quadruples:
+        try:
+            classifier(*quadruple)
+        except ValueError:
+            pass
+
+
+def main(n=20000, repeat=5):
+    quadruples = random_quadruples(n)
+    rng = random.Random(1)
+    points = [Point(rng.random(), rng.random()) for _ in range(150)]
+
+    trig = timeit(lambda: classify_all(trigonometric_by_points, quadruples), number=repeat)
+    orient = timeit(lambda: classify_all(PointType.by_points, quadruples), number=repeat)
+    print(f"by_points x{n}: trigonometric {trig / repeat:.4f}s, orientation {orient / repeat:.4f}s, speedup {trig / orient:.2f}x")
+
+    original = PointType.__dict__["by_points"]
+    for name, run, number in (
+        ("preparata", lambda: list(preparata(list(points))), repeat),
+        ("upper_dynamic_hull", lambda: list(upper_dynamic_hull(list(DYNAMIC_HULL_POINTS), Point(3, 5))), 20 * repeat),
+    ):
+        PointType.by_points = staticmethod(trigonometric_by_points)
+        trig = timeit(run, number=number)
+        PointType.by_points = original
+        orient = timeit(run, number=number)
+        print(f"{name}: trigonometric {trig:.4f}s, orientation {orient:.4f}s, speedup {trig / orient:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
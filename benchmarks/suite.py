@@ -0,0 +1,240 @@
+"""
+Benchmark suite timing every algorithm of the library across point distributions and input sizes.
+
+Each measurement runs in a separate process with a timeout, reporting the best time of several repeats,
+the throughput in points per second and the peak traced memory. Per algorithm and distribution, the scaling
+exponent k of time ~ n^k is fitted over the sizes by least squares in log-log space.
+"""
+import json
+import multiprocessing
+import platform
+import time
+import tracemalloc
+from math import log
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.jarvis import jarvis, jarvis_array
+from PyCompGeomAlgorithms.graham import graham
+from PyCompGeomAlgorithms.monotone_chain import monotone_chain_hull
+from PyCompGeomAlgorithms.quickhull import quickhull
+from PyCompGeomAlgorithms.preparata import preparata
+from PyCompGeomAlgorithms.kd_tree import kd_tree, FlatKDTree
+from PyCompGeomAlgorithms.dynamic_hull import upper_dynamic_hull
+from .distributions import DISTRIBUTIONS
+
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+
+
+def exhaust(generator):
+    res = None
+    for res in generator:
+        pass
+
+    return res
+
+
+def run_jarvis(points):
+    return jarvis(points)
+
+
+def run_jarvis_array(points):
+    return jarvis_array(points)
+
+
+def run_graham(points):
+    return exhaust(graham(points))
+
+
+def run_monotone_chain(points):
+    return monotone_chain_hull(points)
+
+
+def run_quickhull(points):
+    return exhaust(quickhull(points))
+
+
+def run_preparata(points):
+    return exhaust(preparata(points))
+
+
+def run_kd_tree(points):
+    xs, ys = [p.x for p in points], [p.y for p in points]
+    x_range = [min(xs) + (max(xs) - min(xs)) / 4, max(xs) - (max(xs) - min(xs)) / 4]
+    y_range = [min(ys) + (max(ys) - min(ys)) / 4, max(ys) - (max(ys) - min(ys)) / 4]
+    return exhaust(kd_tree(points, x_range, y_range))
+
+
+def run_flat_kd_tree(points):
+    return FlatKDTree(points)
+
+
+def run_upper_dynamic_hull(points):
+    return exhaust(upper_dynamic_hull(points, Point(*points[0].coords)))
+
+
+ALGORITHMS = {
+    "jarvis": run_jarvis,
+    "jarvis_array": run_jarvis_array,
+    "graham": run_graham,
+    "monotone_chain": run_monotone_chain,
+    "quickhull": run_quickhull,
+    "preparata": run_preparata,
+    "kd_tree": run_kd_tree,
+    "flat_kd_tree": run_flat_kd_tree,
+    "upper_dynamic_hull": run_upper_dynamic_hull,
+}
+
+
+def measure(algorithm, distribution, n, repeat=3, seed=0):
+    """Best wall time over repeat runs and peak traced memory of a single run, on fresh copies of the input."""
+    points = DISTRIBUTIONS[distribution](n, seed)
+    run = ALGORITHMS[algorithm]
+
+    best = float("inf")
+    for _ in range(repeat):
+        data = list(points)
+        start = time.perf_counter()
+        run(data)
+        best = min(best, time.perf_counter() - start)
+
+    data = list(points)
+    tracemalloc.start()
+    run(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": best, "throughput": n / best if best else float("inf"), "peak_memory": peak}
+
+
+def _measure_in_child(connection, *args):
+    try:
+        connection.send(("ok", measure(*args)))
+    except BaseException as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+def measure_isolated(algorithm, distribution, n, repeat=3, seed=0, timeout=60):
+    """Run measure in a child process so that crashes, recursion overflows and hangs are reported instead of fatal."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_measure_in_child, args=(sender, algorithm, distribution, n, repeat, seed))
+    process.start()
+    sender.close()
+
+    if receiver.poll(timeout):
+        status, payload = receiver.recv()
+    else:
+        status, payload = "timeout", f"exceeded {timeout}s"
+
+    process.terminate()
+    process.join()
+
+    if status == "ok":
+        return {"status": status, **payload}
+
+    return {"status": status, "error": payload}
+
+
+def scaling_exponent(results):
+    """Least-squares slope of log(time) against log(n) over the successful measurements, or None if there are fewer than two."""
+    pairs = [(log(r["n"]), log(r["seconds"])) for r in results if r["status"] == "ok" and r["seconds"] > 0]
+    if len(pairs) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    variance = sum((x - mean_x) ** 2 for x, _ in pairs)
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / variance if variance else None
+
+
+def run_suite(algorithms=None, distributions=None, sizes=None, repeat=3, seed=0, timeout=60, log_progress=None):
+    """
+        Benchmark every combination; a size is skipped for an algorithm and distribution once a smaller size failed or timed out.
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    distributions = distributions or list(DISTRIBUTIONS)
+    sizes = sorted(sizes or SIZES)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": [],
+        "scaling": [],
+    }
+
+    for algorithm in algorithms:
+        for distribution in distributions:
+            results = []
+            for n in sizes:
+                if results and results[-1]["status"] != "ok":
+                    result = {"status": "skipped", "error": "a smaller size did not succeed"}
+                else:
+                    result = measure_isolated(algorithm, distribution, n, repeat, seed, timeout)
+
+                result = {"algorithm": algorithm, "distribution": distribution, "n": n, **result}
+                results.append(result)
+                if log_progress:
+                    log_progress(format_result(result))
+
+            report["results"].extend(results)
+            report["scaling"].append({
+                "algorithm": algorithm,
+                "distribution": distribution,
+                "exponent": scaling_exponent(results),
+            })
+
+    return report
+
+
+def format_result(result):
+    head = f"{result['algorithm']:>18} {result['distribution']:>14} n={result['n']:<8}"
+    if result["status"] != "ok":
+        return f"{head} {result['status']}: {result['error']}"
+
+    return (
+        f"{head} {result['seconds']:.4f}s {result['throughput']:.0f} pts/s "
+        f"peak {result['peak_memory'] / 2**20:.2f} MiB"
+    )
+
+
+def save_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(baseline, current, tolerance=0.2):
+    """
+        Regressions of current against baseline: measurements slower or more memory-hungry by more than the tolerance
+        ratio, and measurements that succeeded in the baseline but fail now.
+    """
+    key = lambda r: (r["algorithm"], r["distribution"], r["n"])
+    baseline_results = {key(r): r for r in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = baseline_results.get(key(result))
+        if before is None or before["status"] != "ok":
+            continue
+
+        if result["status"] != "ok":
+            regressions.append({**dict(zip(("algorithm", "distribution", "n"), key(result))), "metric": "status", "baseline": "ok", "current": result["status"]})
+            continue
+
+        for metric in ("seconds", "peak_memory"):
+            if before[metric] and result[metric] > before[metric] * (1 + tolerance):
+                regressions.append({
+                    **dict(zip(("algorithm", "distribution", "n"), key(result))),
+                    "metric": metric,
+                    "baseline": before[metric],
+                    "current": result[metric],
+                })
+
+    return regressions
@@ -7,7 +7,7 @@ setup(
     author="artandfi (Artem Fisunenko)",
     author_email="artyom.fisunenko@gmail.com",
     description="An implementation of computational geometry algorithms in Python3.",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks*", "tests*"]),
     keywords=[
         "Python3",
         "computational geometry",
@@ -0,0 +1,76 @@
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.chan import chan, tangent, group_hull, group_hull_indices
+from PyCompGeomAlgorithms.jarvis import jarvis, direction_correct
+
+
+def test_chan1():
+    pts = [
+        Point(1, 4),
+        Point(0, 0),
+        Point(3, 3),
+        Point(3, 1),
+        Point(7, 0),
+        Point(5, 5),
+        Point(5, 2),
+        Point(9, 6),
+    ]
+    hull = [Point(0, 0), Point(1, 4), Point(9, 6), Point(7, 0)]
+
+    ans = chan(pts)
+    assert ans == hull
+
+
+def test_chan2():
+    pts = [Point(3, 3), Point(1, 1), Point(5, 0)]
+    hull = [Point(1, 1), Point(3, 3), Point(5, 0)]
+
+    ans = chan(pts)
+    assert ans == hull
+
+
+def test_chan_matches_jarvis():
+    rng = random.Random(0)
+    for n in (10, 100, 1000):
+        pts = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+        assert chan(pts) == jarvis(pts)
+
+
+def test_chan_with_executor():
+    rng = random.Random(1)
+    pts = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert chan(pts, executor) == jarvis(pts)
+
+
+def test_chan_with_process_pool():
+    rng = random.Random(1)
+    pts = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(2000)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        hull = chan(pts, executor)
+
+    assert hull == jarvis(pts)
+    assert all(any(p is q for q in pts) for p in hull)
+
+
+def test_group_hull_indices():
+    pts = [Point(1, 1), Point(0, 0), Point(2, 0), Point(1, 3), Point(0, 0)]
+
+    assert [pts[i] for i in group_hull_indices(pts)] == group_hull(pts)
+    assert group_hull_indices(pts) == [3, 2, 1]
+
+
+def test_tangent():
+    rng = random.Random(2)
+    hull = group_hull([Point(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(50)])
+
+    for point in (Point(-5, 5), Point(15, 5), Point(5, -5), Point(5, 15), Point(-3, 20)):
+        best = 0
+        for i in range(len(hull)):
+            if direction_correct(point, hull[i], hull[best]):
+                best = i
+
+        assert tangent(hull, point) == best
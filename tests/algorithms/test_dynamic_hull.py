@@ -1,6 +1,9 @@
 from copy import deepcopy
+import random
 from PyCompGeomAlgorithms.core import Point
-from PyCompGeomAlgorithms.dynamic_hull import DynamicHullNode, SubhullThreadedBinTree, DynamicHullTree, PathDirection, upper_dynamic_hull, merge
+from PyCompGeomAlgorithms.monotone_chain import monotone_chain_hull
+from PyCompGeomAlgorithms.predicates import robust_predicates
+from PyCompGeomAlgorithms.dynamic_hull import DynamicHullNode, SubhullThreadedBinTree, DynamicHullTree, PathDirection, upper_dynamic_hull, merge, optimize_dynamic_hull_tree, DynamicHull, HullQueue, HullQueueNode
 
 
 def test_dynamic_hull1():
@@ -329,3 +332,109 @@ def test_merge_segment_and_point2():
     joint_node.left, joint_node.right = segment_node, n3
 
     assert joint_node == merge(segment_node, point_node)
+
+
+def test_dynamic_hull_persistent_update():
+    pts = sorted([Point(3, 10), Point(6, 8), Point(3, 5), Point(2, 8), Point(4, 8), Point(5, 5), Point(3, 3), Point(7, 7), Point(5, 0), Point(0, 0), Point(10, 3)])
+    tree = DynamicHullTree.from_iterable(pts)
+    optimize_dynamic_hull_tree(tree.root)
+    original = deepcopy(tree)
+
+    modified_tree = tree.snapshot()
+    modified_tree.delete(Point(3, 10))
+    modified_tree.optimize_updated_nodes()
+
+    assert tree == original
+    assert [n.point for n in modified_tree.root.subhull.traverse_inorder()] == [Point(0, 0), Point(2, 8), Point(6, 8), Point(7, 7), Point(10, 3)]
+    assert modified_tree.version(0) == original
+
+
+def test_dynamic_hull_without_trace():
+    p2, p1, p3 = Point(3, 3), Point(1, 1), Point(5, 0)
+    ans = upper_dynamic_hull([p2, p1, p3], Point(4, 3), trace=False)
+
+    assert next(ans) == [p1, p2, Point(4, 3), p3]
+    assert next(ans, None) is None
+
+
+def test_hull_queue_bridge_of_chains_split_by_a_vertical_line():
+    left = HullQueueNode(Point(1, 7), HullQueueNode(Point(0, 2), HullQueueNode(Point(0, 1))), HullQueueNode(Point(2, 8), None, HullQueueNode(Point(4, 7))))
+    right = HullQueueNode(Point(5, 9), HullQueueNode(Point(4, 10)))
+    for node in [left.left.left, left.left, left.right.right, left.right, left, right.left, right]:
+        node.set_height()
+
+    assert HullQueue.bridge(left, right, 1) == (Point(1, 7), Point(4, 10))
+    assert [n.data for n in HullQueue().concatenate(left, right, 1).iter_inorder()] == [
+        Point(0, 1), Point(0, 2), Point(1, 7), Point(4, 10), Point(5, 9)
+    ]
+    assert [n.data for n in left.iter_inorder()] == [Point(0, 1), Point(0, 2), Point(1, 7), Point(2, 8), Point(4, 7)]
+
+
+def test_dynamic_hull_insert_and_delete():
+    hull = DynamicHull([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4), Point(2, 2)])
+    assert hull.hull() == [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]
+
+    hull.insert(Point(2, 6))
+    assert hull.upper_hull() == [Point(0, 0), Point(0, 4), Point(2, 6), Point(4, 4)]
+    assert hull.lower_hull() == [Point(0, 0), Point(4, 0), Point(4, 4)]
+
+    hull.delete(Point(0, 0))
+    hull.delete(Point(4, 0))
+    assert hull.hull() == [Point(0, 4), Point(2, 2), Point(4, 4), Point(2, 6)]
+    assert len(hull) == 4 and Point(2, 2) in hull and Point(4, 0) not in hull
+
+
+def test_dynamic_hull_random_updates():
+    rng = random.Random(0)
+    for grid in [3, 10, None]:
+        hull, points = DynamicHull(), {}
+        for _ in range(300):
+            if points and rng.random() < 0.4:
+                hull.delete(points.pop(rng.choice(list(points))))
+            else:
+                point = Point(rng.randint(0, grid), rng.randint(0, grid)) if grid else Point(rng.random(), rng.random())
+                points[point.coords] = point
+                hull.insert(point)
+
+            assert hull.hull() == monotone_chain_hull(list(points.values()))
+
+
+def test_dynamic_hull_near_degenerate_with_robust_predicates():
+    points = [
+        Point(1.9999999999999996, 4.0), Point(7.0, 7.000000000000001), Point(12.000000000000004, 11.999999999999998),
+        Point(12.0, 6.000000000000002), Point(7.000000000000001, 3.5000000000000004), Point(0.09999999999999999, 0.09999999999999998),
+        Point(1.9999999999999998, 1.9999999999999998), Point(0.3333333333333332, 0.3333333333333332), Point(11.999999999999996, 12.0),
+        Point(0.10000000000000002, 0.10000000000000098), Point(7.0, 3.4999999999999996), Point(7.000000000000002, 7.000000000000002),
+        Point(7.0, 3.4999999999999987), Point(2.0, 1.0000000000000007),
+    ]
+
+    with robust_predicates() as stats:
+        stats.reset()
+        hull = DynamicHull(points).hull()
+
+        assert [p.coords for p in hull] == [p.coords for p in monotone_chain_hull(points)]
+        assert stats.exact_calls > 0
+
+
+def test_dynamic_hull_versions():
+    points = [Point(3, 10), Point(6, 8), Point(3, 5), Point(2, 8), Point(4, 8), Point(5, 5), Point(3, 3), Point(7, 7), Point(5, 0), Point(0, 0), Point(10, 3)]
+    hull = DynamicHull(points, keep_versions=True)
+    snapshot = hull.snapshot()
+
+    hull.delete(Point(3, 10))
+    hull.insert(Point(12, 12))
+
+    assert snapshot.hull() == monotone_chain_hull(points)
+    assert hull.version(0).hull() == snapshot.hull()
+    assert hull.version(1).upper_hull() == [Point(0, 0), Point(2, 8), Point(6, 8), Point(7, 7), Point(10, 3)]
+    assert hull.upper_hull() == [Point(0, 0), Point(2, 8), Point(12, 12)]
+
+
+def test_dynamic_hull_keeps_no_versions_by_default():
+    hull = DynamicHull([Point(0, 0), Point(4, 0), Point(2, 3)])
+    for x in range(10):
+        hull.insert(Point(x, 5))
+        hull.delete(Point(x, 5))
+
+    assert hull.versions == []
+    assert hull.hull() == [Point(0, 0), Point(4, 0), Point(2, 3)]
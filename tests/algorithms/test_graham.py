@@ -186,3 +186,11 @@ def test_graham3():
     assert next(ans) == steps_table
     
     assert next(ans) == hull
+
+
+def test_graham_without_trace():
+    pts = [Point(3, 10), Point(6, 8), Point(3, 5), Point(2, 8), Point(4, 8), Point(5, 5), Point(3, 3), Point(7, 7), Point(5, 0), Point(0, 0), Point(10, 3)]
+    ans = graham(list(pts), trace=False)
+
+    assert next(ans) == list(graham(list(pts)))[-1]
+    assert next(ans, None) is None
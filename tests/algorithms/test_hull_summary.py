@@ -0,0 +1,48 @@
+import json
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.monotone_chain import monotone_chain_hull, merge_hulls
+from PyCompGeomAlgorithms.hull_summary import HullSummary
+
+
+def shards(n, size, seed=0):
+    rng = random.Random(seed)
+    points = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)]
+    return points, [points[i:i+size] for i in range(0, n, size)]
+
+
+def test_merge_hulls():
+    hull1 = monotone_chain_hull([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)])
+    hull2 = monotone_chain_hull([Point(2, 2), Point(6, 2), Point(6, 6), Point(2, 6)])
+
+    assert merge_hulls(hull1, hull2) == [Point(0, 0), Point(4, 0), Point(6, 2), Point(6, 6), Point(2, 6), Point(0, 4)]
+    assert merge_hulls(hull1, []) == hull1
+
+
+def test_hull_summary_reduce():
+    points, parts = shards(1000, 70)
+    summary = HullSummary.reduce(HullSummary.from_points(part) for part in parts)
+
+    assert summary.hull == monotone_chain_hull(points)
+    assert summary.count == 1000
+    assert HullSummary.reduce([]) == HullSummary()
+
+
+def test_hull_summary_serialization():
+    _, parts = shards(100, 100, seed=1)
+    summary = HullSummary.from_points(parts[0])
+
+    assert pickle.loads(pickle.dumps(summary)) == summary
+    assert HullSummary.from_dict(json.loads(json.dumps(summary.to_dict()))) == summary
+
+
+def test_hull_summary_reduce_with_process_pool():
+    points, parts = shards(2000, 150, seed=2)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        summaries = executor.map(HullSummary.from_points, parts)
+        summary = HullSummary.reduce(summaries, executor)
+
+    assert summary == HullSummary(monotone_chain_hull(points), 2000)
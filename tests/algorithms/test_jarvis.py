@@ -1,5 +1,7 @@
-from PyCompGeomAlgorithms.core import Point
-from PyCompGeomAlgorithms.jarvis import jarvis
+import random
+from PyCompGeomAlgorithms.core import Point, PointArray
+from PyCompGeomAlgorithms.jarvis import jarvis, jarvis_array
+from PyCompGeomAlgorithms.predicates import robust_predicates
 
 
 def test_jarvis1():
@@ -25,3 +27,31 @@ def test_jarvis2():
 
     ans = jarvis(pts)
     assert ans == hull
+
+
+def test_jarvis_collinear_leftmost_points():
+    pts = [Point(0, 2), Point(0, 0), Point(0, 4), Point(3, 0), Point(3, 4), Point(1, 1)]
+    hull = [Point(0, 0), Point(0, 4), Point(3, 4), Point(3, 0)]
+
+    assert jarvis(pts) == hull
+    assert jarvis_array(pts) == hull
+
+
+def test_jarvis_array():
+    rng = random.Random(0)
+    pts = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(500)]
+    hull = jarvis(pts)
+
+    assert jarvis_array(pts) == hull
+    assert jarvis_array(PointArray.from_points(pts)) == hull
+    assert jarvis_array([Point(3, 3), Point(1, 1), Point(5, 0)]) == [Point(1, 1), Point(3, 3), Point(5, 0)]
+
+
+def test_jarvis_array_near_degenerate_with_robust_predicates():
+    # Float orientation of these nearly collinear points is inconsistent, so the plain march never gets back to the start
+    pts = [Point(0.5000000000000017, 0.5), Point(24.0, 24.0), Point(0.5000000000000019, 0.5000000000000012)]
+
+    with robust_predicates() as stats:
+        stats.reset()
+        assert jarvis_array(pts) == jarvis(pts) == [pts[0], pts[2], pts[1]]
+        assert stats.exact_calls > 0
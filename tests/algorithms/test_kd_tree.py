@@ -1,5 +1,9 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import pytest
 from PyCompGeomAlgorithms.core import Point, BinTreeNode
-from PyCompGeomAlgorithms.kd_tree import KDTree, kd_tree
+from PyCompGeomAlgorithms.kd_tree import KDTree, FlatKDTree, kd_tree
 
 
 def test_kd_tree():
@@ -89,3 +93,159 @@ def test_kd_tree():
     assert next(ans) == tree
     assert next(ans) == search_list
     assert sorted(next(ans)) == result
+
+
+def test_kd_tree_without_trace():
+    pts = [Point(0, 9), Point(2, 3), Point(3, 6), Point(5, 8), Point(6, 1), Point(8, 13), Point(10, 2), Point(12, 4), Point(14, 11), Point(15, 5), Point(17, 10)]
+    ans = kd_tree(pts, [3, 14], [0, 8], trace=False)
+
+    assert sorted(next(ans)) == sorted(list(kd_tree(pts, [3, 14], [0, 8]))[-1])
+    assert next(ans, None) is None
+
+
+def check_flat_kd_tree(tree, slot, start, stop, axis):
+    """Check that the subtree rooted at slot takes the slots from start to stop and is split correctly; return its depth."""
+    assert slot == (start + stop) // 2 and tree.axis[slot] == axis
+    coords = tree.xs if axis == 0 else tree.ys
+    assert tree.split[slot] == coords[slot]
+    assert all(coords[i] <= tree.split[slot] for i in range(start, slot))
+    assert all(coords[i] >= tree.split[slot] for i in range(slot + 1, stop))
+
+    depth = 0
+    if tree.left[slot] != -1:
+        depth = check_flat_kd_tree(tree, tree.left[slot], start, slot, 1 - axis)
+    else:
+        assert start == slot
+    if tree.right[slot] != -1:
+        depth = max(depth, check_flat_kd_tree(tree, tree.right[slot], slot + 1, stop, 1 - axis))
+    else:
+        assert slot + 1 == stop
+
+    return depth + 1
+
+
+def test_flat_kd_tree_build():
+    rng = random.Random(0)
+    pts = [Point(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(500)]
+    tree = FlatKDTree(pts)
+
+    assert sorted(tree.index) == list(range(500))
+    assert all(pts[tree.index[i]].coords == (tree.xs[i], tree.ys[i]) for i in range(500))
+    assert check_flat_kd_tree(tree, tree.root, 0, 500, 0) == 9
+    assert FlatKDTree([]).root == -1
+
+
+def test_flat_kd_tree_build_matches_kd_tree_partition():
+    pts = [Point(0, 9), Point(2, 3), Point(3, 6), Point(5, 8), Point(6, 1), Point(8, 13), Point(10, 2), Point(12, 4), Point(14, 11), Point(15, 5), Point(17, 10)]
+    tree = FlatKDTree(pts)
+    root = tree.root
+
+    assert tree.points[tree.index[root]] == Point(8, 13)
+    assert tree.points[tree.index[tree.left[root]]] == Point(3, 6)
+    assert tree.points[tree.index[tree.right[root]]] == Point(15, 5)
+
+
+def test_flat_kd_tree_region_search():
+    rng = random.Random(1)
+    for grid in [3, 100]:
+        pts = [Point(rng.randint(0, grid), rng.randint(0, grid)) for _ in range(300)]
+        tree = FlatKDTree(pts)
+        for _ in range(50):
+            x_range = sorted(rng.uniform(-1, grid + 1) for _ in range(2))
+            y_range = sorted(rng.randint(-1, grid + 1) for _ in range(2))
+
+            expected = [i for i, p in enumerate(pts) if x_range[0] <= p.x <= x_range[1] and y_range[0] <= p.y <= y_range[1]]
+            assert sorted(tree.region_indices(x_range, y_range)) == expected
+            assert sorted(tree.region_search(x_range, y_range)) == sorted(pts[i] for i in expected)
+
+
+def test_flat_kd_tree_reports_whole_subtrees():
+    pts = [Point(x, y) for x in range(10) for y in range(10)]
+    tree = FlatKDTree(pts)
+
+    assert list(tree.region_slots([0, 9], [0, 9])) == [(0, 100)]
+    assert list(tree.region_slots([20, 30], [0, 9])) == []
+    assert len(list(islice(tree.region_search([0, 4], [0, 9]), 10))) == 10
+
+
+def test_flat_kd_tree_nearest_and_within_radius():
+    rng = random.Random(2)
+    pts = [Point(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(300)]
+    tree = FlatKDTree(pts)
+
+    for metric in ["euclidean", "manhattan", "chebyshev"]:
+        for _ in range(20):
+            point, k, radius = Point(rng.uniform(-5, 55), rng.uniform(-5, 55)), rng.randint(1, 10), rng.uniform(0, 20)
+
+            distances = [Point.dist(p, point, metric) for p in tree.nearest(point, k, metric)]
+            assert distances == sorted(Point.dist(p, point, metric) for p in pts)[:k]
+            assert sorted(tree.within_radius(point, radius, metric)) == sorted(p for p in pts if Point.dist(p, point, metric) <= radius)
+
+
+def test_flat_kd_tree_nearest_edge_cases():
+    tree = FlatKDTree([Point(0, 0), Point(3, 4), Point(1, 1)])
+
+    assert tree.nearest(Point(3, 3)) == [Point(3, 4)]
+    assert tree.nearest(Point(3, 3), k=5) == [Point(3, 4), Point(1, 1), Point(0, 0)]
+    assert tree.nearest(Point(3, 3), k=0) == []
+    assert FlatKDTree([]).nearest(Point(0, 0)) == []
+    with pytest.raises(ValueError):
+        tree.nearest(Point(0, 0), metric="cosine")
+
+
+def random_rectangles(rng, count, size):
+    res = []
+    for _ in range(count):
+        x, y = rng.uniform(0, size), rng.uniform(0, size)
+        res.append(([x, x + rng.uniform(0, size / 4)], [y, y + rng.uniform(0, size / 4)]))
+
+    return res
+
+
+def test_flat_kd_tree_query_many():
+    rng = random.Random(3)
+    pts = [Point(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(500)]
+    rectangles = random_rectangles(rng, 40, 100)
+    offsets, indices = FlatKDTree(pts).query_many(rectangles)
+
+    assert len(offsets) == 41 and offsets[0] == 0 and offsets[-1] == len(indices)
+    for i, (x_range, y_range) in enumerate(rectangles):
+        expected = [j for j, p in enumerate(pts) if x_range[0] <= p.x <= x_range[1] and y_range[0] <= p.y <= y_range[1]]
+        assert sorted(indices[offsets[i]:offsets[i + 1]]) == expected
+
+    assert list(FlatKDTree(pts).query_many([])[0]) == [0]
+
+
+def test_flat_kd_tree_query_many_with_process_pool():
+    rng = random.Random(4)
+    tree = FlatKDTree([Point(rng.random(), rng.random()) for _ in range(2000)])
+    rectangles = random_rectangles(rng, 300, 1)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert tree.query_many(rectangles, executor, chunk_size=64) == tree.query_many(rectangles)
+
+
+def test_flat_kd_tree_region_summary():
+    rng = random.Random(5)
+    pts = [Point(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(400)]
+    weights = [rng.randint(1, 9) for _ in pts]
+
+    for tree in [FlatKDTree(pts, weights), FlatKDTree(pts, weights, summaries=True)]:
+        for x_range, y_range in random_rectangles(rng, 30, 50) + [([-1, 51], [-1, 51]), ([60, 70], [0, 50])]:
+            found = [i for i, p in enumerate(pts) if x_range[0] <= p.x <= x_range[1] and y_range[0] <= p.y <= y_range[1]]
+            bounds = (
+                min(pts[i].x for i in found), max(pts[i].x for i in found), min(pts[i].y for i in found), max(pts[i].y for i in found)
+            ) if found else None
+
+            count, weight, box = tree.region_summary(x_range, y_range)
+            assert (count, weight, box and tuple(box)) == (len(found), sum(weights[i] for i in found), bounds)
+            assert tree.count_region(x_range, y_range) == len(found)
+
+
+def test_flat_kd_tree_summaries():
+    tree = FlatKDTree([Point(0, 0), Point(2, 5), Point(4, 1)], summaries=True)
+
+    assert tuple(tree.boxes[4 * tree.root:4 * tree.root + 4]) == (0, 4, 0, 5)
+    assert tree.region_summary([0, 4], [0, 4]) == (2, 2, (0, 4, 0, 1))
+    with pytest.raises(ValueError):
+        FlatKDTree([Point(0, 0)], weights=[1, 2])
@@ -0,0 +1,47 @@
+import random
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.monotone_chain import monotone_chain, monotone_chain_hull
+from PyCompGeomAlgorithms.graham import graham, graham_hull
+
+
+def test_monotone_chain():
+    pts = [
+        Point(3, 10),
+        Point(6, 8),
+        Point(3, 5),
+        Point(2, 8),
+        Point(4, 8),
+        Point(5, 5),
+        Point(3, 3),
+        Point(7, 7),
+        Point(5, 0),
+        Point(0, 0),
+        Point(10, 3),
+    ]
+    lower = [Point(0, 0), Point(5, 0), Point(10, 3)]
+    upper = [Point(0, 0), Point(2, 8), Point(3, 10), Point(6, 8), Point(7, 7), Point(10, 3)]
+
+    assert monotone_chain(pts) == (lower, upper)
+    assert monotone_chain(sorted(pts, key=lambda p: p.coords), presorted=True) == (lower, upper)
+    assert monotone_chain_hull(pts) == [Point(0, 0), Point(5, 0), Point(10, 3), Point(7, 7), Point(6, 8), Point(3, 10), Point(2, 8)]
+
+
+def test_monotone_chain_collinear():
+    pts = [Point(2, 2), Point(0, 0), Point(1, 1), Point(3, 3)]
+
+    assert monotone_chain(pts) == ([Point(0, 0), Point(3, 3)], [Point(0, 0), Point(3, 3)])
+    assert monotone_chain_hull(pts) == [Point(0, 0), Point(3, 3)]
+
+
+def test_monotone_chain_degenerate_square():
+    pts = [Point(x, y) for x in range(4) for y in range(4)]
+
+    assert monotone_chain_hull(pts) == [Point(0, 0), Point(3, 0), Point(3, 3), Point(0, 3)]
+
+
+def test_graham_hull_matches_graham():
+    rng = random.Random(0)
+    pts = [Point(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+
+    *_, hull = graham(pts)
+    assert graham_hull(pts) == hull
@@ -1,5 +1,7 @@
+import random
 from PyCompGeomAlgorithms.core import Point, PathDirection
-from PyCompGeomAlgorithms.preparata import preparata, PreparataThreadedBinTree
+from PyCompGeomAlgorithms.preparata import preparata, PreparataThreadedBinTree, PreparataHull
+from PyCompGeomAlgorithms.monotone_chain import monotone_chain_hull
 
 
 def test_preparata1():
@@ -142,4 +144,41 @@ def test_preparata5():
     assert next(ans) == ((left_paths, left_supporting_points), (right_paths, right_supporting_points))
     assert next(ans) == deleted_points
     assert next(ans) == (hulls, trees)
-    assert next(ans) == hull
\ No newline at end of file
+    assert next(ans) == hull
+
+
+def test_preparata_without_trace():
+    points = [Point(7, 0), Point(3, 3), Point(0, 0), Point(10, 8), Point(7, 4), Point(12, 2)]
+    ans = preparata(list(points), trace=False)
+
+    assert next(ans) == list(preparata(list(points)))[-1]
+    assert next(ans, None) is None
+
+
+def test_preparata_repeated_hull_vertex():
+    ans = list(preparata([Point(2, 3), Point(2, 3), Point(1, 0), Point(1, 2)]))
+
+    assert ans[-1] == [Point(1, 0), Point(1, 2), Point(2, 3)]
+
+
+def test_preparata_hull_online():
+    hull = PreparataHull()
+    for point in [Point(2, 2), Point(0, 0), Point(4, 0), Point(1, 1), Point(2, 5), Point(4, 4), Point(0, 4)]:
+        hull.add(point)
+
+    assert hull.hull() == [Point(0, 0), Point(0, 4), Point(2, 5), Point(4, 4), Point(4, 0)]
+    assert hull.contains(Point(2, 2))
+    assert hull.contains(Point(0, 2))
+    assert not hull.contains(Point(3, 5))
+    assert not hull.add(Point(3, 3))
+    assert hull.add(Point(6, 2))
+    assert hull.hull() == [Point(0, 0), Point(0, 4), Point(2, 5), Point(4, 4), Point(6, 2), Point(4, 0)]
+
+
+def test_preparata_hull_matches_monotone_chain():
+    rng = random.Random(0)
+    points = [Point(rng.random(), rng.random()) for _ in range(1000)]
+    expected = monotone_chain_hull(points)
+
+    assert next(preparata(list(points), trace=False)) == expected[:1] + expected[:0:-1]
+    assert PreparataHull(points).hull() == expected[:1] + expected[:0:-1]
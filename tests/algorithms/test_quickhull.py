@@ -1,5 +1,9 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from math import nextafter
 from PyCompGeomAlgorithms.core import Point
-from PyCompGeomAlgorithms.quickhull import QuickhullNode, QuickhullTree, quickhull
+from PyCompGeomAlgorithms.quickhull import QuickhullNode, QuickhullTree, quickhull, quickhull_hull, octagon_filter
+from PyCompGeomAlgorithms.predicates import robust_predicates
 
 
 def test_quickhull1():
@@ -94,3 +98,73 @@ def test_quickhull2():
     assert next(ans) == tree
     assert next(ans) == tree
     assert next(ans) == hull
+
+
+def test_quickhull_without_trace():
+    pts = [Point(0, 6), Point(8, 11), Point(10, 4), Point(7, 13), Point(6, 3), Point(3, 0), Point(4, 2), Point(12, 1), Point(14, 10), Point(5, 9), Point(3, 11), Point(1, 4)]
+    ans = quickhull(pts, trace=False)
+
+    assert next(ans) == list(quickhull(pts))[-1]
+    assert next(ans, None) is None
+
+
+def test_quickhull_hull_in_convex_position():
+    n = 2000
+    pts = [Point(i, i * i) for i in range(-n, n + 1)] + [Point(i, 2 * n * n - i * i) for i in range(-n + 1, n)]
+    random.Random(0).shuffle(pts)
+    hull = quickhull_hull(pts)
+
+    assert len(hull) == len(pts)
+    assert hull[0] == Point(-n, n * n)
+    assert all(Point.direction(hull[i-2], hull[i-1], hull[i]) > 0 for i in range(len(hull)))
+
+
+def test_quickhull_hull_matches_quickhull():
+    rng = random.Random(1)
+    for _ in range(50):
+        pts = [Point(rng.randint(0, 6), rng.randint(0, 6)) for _ in range(rng.randint(3, 30))]
+        assert quickhull_hull(pts) == list(quickhull(pts))[-1]
+
+
+def test_octagon_filter():
+    pts = [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4), Point(2, 2), Point(1, 1), Point(2, 0), Point(3, 2)]
+    xs, ys = [p.x for p in pts], [p.y for p in pts]
+
+    assert octagon_filter(xs, ys, range(len(pts))) == [0, 1, 2, 3, 6]
+
+
+def test_quickhull_with_process_pool():
+    rng = random.Random(2)
+    pts = [Point(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(2000)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert quickhull_hull(pts, executor, threshold=100) == quickhull_hull(pts)
+        assert next(quickhull(pts, trace=False, executor=executor)) == quickhull_hull(pts)
+
+
+def near_degenerate_points(n=16):
+    pts = [Point(0.0, 0.0), Point(12.0, 12.0), Point(24.0, 24.0)]
+    x = 0.5
+    for _ in range(n):
+        y = 0.5
+        for _ in range(n):
+            pts.append(Point(x, y))
+            y = nextafter(y, 1)
+        x = nextafter(x, 1)
+
+    return pts
+
+
+def test_quickhull_hull_with_robust_predicates():
+    pts = near_degenerate_points()
+
+    with robust_predicates() as stats:
+        stats.reset()
+        hull = next(quickhull(pts, trace=False))
+
+        assert stats.exact_calls > 0
+        assert all(Point.direction(hull[i-2], hull[i-1], hull[i]) > 0 for i in range(len(hull)))
+        assert all(Point.direction(hull[i-1], hull[i], p) >= 0 for i in range(len(hull)) for p in pts)
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert quickhull_hull(pts, executor, threshold=50) == hull
@@ -0,0 +1,53 @@
+import asyncio
+import random
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.preparata import preparata
+from PyCompGeomAlgorithms.streaming import StreamingHull, streaming_hull, async_streaming_hull
+
+
+def random_points(n, seed=0):
+    rng = random.Random(seed)
+    return [Point(rng.random(), rng.random()) for _ in range(n)]
+
+
+def test_streaming_hull():
+    points = random_points(1000)
+    snapshots = list(streaming_hull(iter(points), chunk_size=100))
+
+    assert len(snapshots) == 10
+    assert snapshots[0] == next(preparata(points[:100], trace=False))
+    assert snapshots[4] == next(preparata(points[:500], trace=False))
+    assert snapshots[-1] == next(preparata(points, trace=False))
+
+
+def test_streaming_hull_from_generator():
+    points = random_points(250, seed=1)
+    *_, hull = streaming_hull((p for p in points), chunk_size=64)
+
+    assert hull == next(preparata(points, trace=False))
+
+
+def test_async_streaming_hull():
+    points = random_points(300, seed=2)
+
+    async def produce():
+        for point in points:
+            await asyncio.sleep(0)
+            yield point
+
+    async def collect():
+        return [hull async for hull in async_streaming_hull(produce(), chunk_size=128)]
+
+    snapshots = asyncio.run(collect())
+    assert len(snapshots) == 3
+    assert snapshots[-1] == next(preparata(points, trace=False))
+
+
+def test_streaming_hull_snapshot_on_demand():
+    hull = StreamingHull(chunk_size=2)
+    hull.add_chunk([Point(0, 0), Point(4, 0)])
+    assert hull.snapshot() == [Point(0, 0), Point(4, 0)]
+
+    hull.add_chunk([Point(2, 3), Point(2, 1), Point(2, -3)])
+    assert hull.snapshot() == [Point(0, 0), Point(2, 3), Point(4, 0), Point(2, -3)]
+    assert hull.contains(Point(2, 1))
@@ -0,0 +1,68 @@
+from math import isclose
+from benchmarks.suite import compare_reports, scaling_exponent
+
+
+def result(n, seconds=1.0, peak_memory=1000, status="ok", algorithm="jarvis", distribution="uniform"):
+    if status != "ok":
+        return {"algorithm": algorithm, "distribution": distribution, "n": n, "status": status, "error": "failed"}
+
+    return {
+        "algorithm": algorithm,
+        "distribution": distribution,
+        "n": n,
+        "status": status,
+        "seconds": seconds,
+        "throughput": n / seconds if seconds else float("inf"),
+        "peak_memory": peak_memory,
+    }
+
+
+def report(*results):
+    return {"results": list(results), "scaling": []}
+
+
+def test_scaling_exponent():
+    assert isclose(scaling_exponent([result(10, 0.1), result(100, 1.0), result(1000, 10.0)]), 1)
+    assert isclose(scaling_exponent([result(10, 0.01), result(100, 1.0)]), 2)
+    assert isclose(scaling_exponent([result(10, 0.1), result(100, 1.0), result(1000, status="timeout")]), 1)
+
+
+def test_scaling_exponent_undefined():
+    assert scaling_exponent([]) is None
+    assert scaling_exponent([result(10, 0.1), result(100, status="error")]) is None
+    assert scaling_exponent([result(10, 0.1), result(10, 0.2)]) is None
+    assert scaling_exponent([result(10, 0.0), result(100, 1.0)]) is None
+
+
+def test_compare_reports_pass():
+    baseline = report(result(100, 1.0, 1000), result(1000, 10.0, 10000))
+    current = report(result(100, 0.5, 1000), result(1000, 11.0, 9000), result(10000, 100.0, 100000))
+
+    assert compare_reports(baseline, current) == []
+
+
+def test_compare_reports_fail():
+    baseline = report(result(100, 1.0, 1000), result(1000, 10.0, 10000), result(10000, 100.0, 100000))
+    current = report(result(100, 1.5, 1000), result(1000, 10.0, 20000), result(10000, status="timeout"))
+
+    assert compare_reports(baseline, current) == [
+        {"algorithm": "jarvis", "distribution": "uniform", "n": 100, "metric": "seconds", "baseline": 1.0, "current": 1.5},
+        {"algorithm": "jarvis", "distribution": "uniform", "n": 1000, "metric": "peak_memory", "baseline": 10000, "current": 20000},
+        {"algorithm": "jarvis", "distribution": "uniform", "n": 10000, "metric": "status", "baseline": "ok", "current": "timeout"},
+    ]
+
+
+def test_compare_reports_ignores_baseline_failures():
+    baseline = report(result(100, status="error"), result(1000, status="skipped"))
+    current = report(result(100, 5.0), result(1000, status="timeout"))
+
+    assert compare_reports(baseline, current) == []
+
+
+def test_compare_reports_threshold():
+    baseline = report(result(100, 1.0, 1000))
+
+    assert compare_reports(baseline, report(result(100, 1.2, 1200))) == []
+    assert [r["metric"] for r in compare_reports(baseline, report(result(100, 1.21, 1201)))] == ["seconds", "peak_memory"]
+    assert compare_reports(baseline, report(result(100, 1.4, 1400)), tolerance=0.5) == []
+    assert [r["metric"] for r in compare_reports(baseline, report(result(100, 1.01, 1000)), tolerance=0)] == ["seconds"]
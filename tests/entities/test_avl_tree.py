@@ -1,4 +1,6 @@
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+import pytest
 from PyCompGeomAlgorithms.core import BinTreeNode, AVLTree
 
 def test_avl_tree_insertion_no_imbalance():
@@ -231,4 +233,134 @@ def test_avl_tree_insertion_of_prefilled_node():
     test_tree.insert(BinTreeNode(0))
 
     tree = AVLTree(BinTreeNode(1, BinTreeNode(0), BinTreeNode(2)))
-    assert tree == test_tree
\ No newline at end of file
+    assert tree == test_tree
+
+
+def test_avl_tree_order_statistics():
+    test_tree = AVLTree.from_iterable(range(0, 20, 2))
+    for value in (5, 13, -1, 25):
+        test_tree.insert(value)
+    test_tree.delete(8)
+    values = sorted([*range(0, 20, 2), 5, 13, -1, 25])
+    values.remove(8)
+
+    assert test_tree.root.size == len(values)
+    assert [test_tree.select(i) for i in range(len(values))] == values
+    assert test_tree.rank(5) == values.index(5)
+    assert test_tree.rank(5, inclusive=True) == values.index(5) + 1
+    assert test_tree.rank(7) == test_tree.rank(7, inclusive=True) == values.index(10)
+    assert test_tree.count_range(3, 14) == len([v for v in values if 3 <= v <= 14])
+    assert test_tree.count_range(14, 3) == 0
+    assert test_tree.select(-1) == 25
+    with pytest.raises(IndexError):
+        test_tree.select(len(values))
+    with pytest.raises(IndexError):
+        AVLTree(None).select(0)
+
+
+def assert_balanced(node):
+    if node is None:
+        return
+
+    assert abs(node.balance_factor) <= 1
+    assert_balanced(node.left)
+    assert_balanced(node.right)
+
+
+def test_avl_tree_split_join():
+    test_tree = AVLTree.from_iterable(range(1, 21))
+    left, pivot, right = test_tree.split(8)
+
+    assert [n.data for n in left.traverse_inorder()] == list(range(1, 8))
+    assert pivot == 8
+    assert [n.data for n in right.traverse_inorder()] == list(range(9, 21))
+
+    joined = AVLTree.join(left, 8.5, right)
+    assert [n.data for n in joined.traverse_inorder()] == [*range(1, 8), 8.5, *range(9, 21)]
+    assert_balanced(joined.root)
+
+
+def test_avl_tree_split_missing_key():
+    left, pivot, right = AVLTree.from_iterable(range(0, 10, 2)).split(5)
+
+    assert pivot is None
+    assert [n.data for n in left.traverse_inorder()] == [0, 2, 4]
+    assert [n.data for n in right.traverse_inorder()] == [6, 8]
+
+
+def test_avl_tree_bulk_operations():
+    test_tree = AVLTree.from_iterable(range(0, 100, 3))
+    test_tree.insert_many(range(0, 100, 5))
+    expected = sorted(set(range(0, 100, 3)) | set(range(0, 100, 5)))
+
+    assert [n.data for n in test_tree.traverse_inorder()] == expected
+    assert test_tree.root.size == len(expected)
+    assert_balanced(test_tree.root)
+
+    test_tree.difference(AVLTree.from_iterable(range(0, 100, 2)))
+    expected = [v for v in expected if v % 2]
+
+    assert [n.data for n in test_tree.traverse_inorder()] == expected
+    assert_balanced(test_tree.root)
+
+
+def test_avl_tree_insert_many_duplicates():
+    test_tree = AVLTree.from_iterable([1, 3, 5])
+    test_tree.insert_many([2, 2, 3, 4, 4])
+
+    assert [n.data for n in test_tree.traverse_inorder()] == [1, 2, 3, 4, 5]
+    assert test_tree.root.size == 5
+    assert_balanced(test_tree.root)
+
+
+def test_avl_tree_bulk_operations_in_executor():
+    test_tree = AVLTree.from_iterable(range(0, 1000, 2))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        test_tree.union(AVLTree.from_iterable(range(0, 1000, 3)), executor=executor)
+        test_tree.difference(AVLTree.from_iterable(range(0, 1000, 6)), executor=executor)
+
+    expected = sorted((set(range(0, 1000, 2)) | set(range(0, 1000, 3))) - set(range(0, 1000, 6)))
+    assert [n.data for n in test_tree.traverse_inorder()] == expected
+    assert_balanced(test_tree.root)
+
+
+def test_avl_tree_persistent_versions():
+    test_tree = AVLTree.from_iterable(range(1, 16)).snapshot()
+    original = deepcopy(test_tree)
+
+    for value in (16, 17, 18):
+        test_tree.insert(value)
+    test_tree.delete(8)
+
+    assert len(test_tree.versions) == 4
+    assert test_tree.version(0) == original
+    assert [n.data for n in test_tree.version(3).traverse_inorder()] == list(range(1, 19))
+    assert [n.data for n in test_tree.traverse_inorder()] == [*range(1, 8), *range(9, 19)]
+    assert_balanced(test_tree.root)
+
+
+def test_avl_tree_persistent_update_shares_nodes():
+    test_tree = AVLTree.from_iterable(range(1, 32))
+    snapshot = test_tree.snapshot()
+    test_tree.insert(32)
+
+    old_nodes = {id(n) for n in snapshot.traverse_inorder()}
+    new_nodes = [n for n in test_tree.traverse_inorder() if id(n) not in old_nodes]
+
+    assert len(new_nodes) <= 2 * test_tree.root.height + 2
+    assert [n.data for n in snapshot.traverse_inorder()] == list(range(1, 32))
+
+
+def test_avl_tree_persistent_bulk_operations_in_executor():
+    test_tree = AVLTree.from_iterable(range(0, 1000, 2))
+    snapshot = test_tree.snapshot()
+    original = deepcopy(snapshot)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        test_tree.union(AVLTree.from_iterable(range(0, 1000, 3)), executor=executor)
+        test_tree.difference(AVLTree.from_iterable(range(0, 1000, 5)), executor=executor)
+
+    assert snapshot == original
+    assert [n.data for n in snapshot.traverse_inorder()] == list(range(0, 1000, 2))
+    assert [n.data for n in test_tree.traverse_inorder()] == sorted((set(range(0, 1000, 2)) | set(range(0, 1000, 3))) - set(range(0, 1000, 5)))
+    assert_balanced(test_tree.root)
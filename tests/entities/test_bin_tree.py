@@ -1,3 +1,4 @@
+import pytest
 from PyCompGeomAlgorithms.core import BinTree, BinTreeNode
 
 
@@ -34,3 +35,52 @@ def test_bin_tree_node_copy_contents_without_children_same_node():
     assert root1.data == "R1_2" and root1.field == 12
     assert root1.left.data == "R1_1" and root1.left.field == 11
     assert root1.right.data == "R1_3" and root1.right.field == 13
+
+
+def test_bin_tree_traversals():
+    tree = BinTree.from_iterable(range(1, 8))
+
+    assert [n.data for n in tree.traverse_preorder()] == [4, 2, 1, 3, 6, 5, 7]
+    assert [n.data for n in tree.traverse_inorder()] == [1, 2, 3, 4, 5, 6, 7]
+    assert [n.data for n in tree.traverse_postorder()] == [1, 3, 2, 5, 7, 6, 4]
+    assert [n.data for n in tree.leaves_inorder()] == [1, 3, 5, 7]
+    assert BinTree.empty().traverse_inorder() == []
+
+
+def test_bin_tree_traversal_is_lazy():
+    tree = BinTree.from_iterable(range(1, 8))
+    leaves = tree.iter_leaves_inorder()
+
+    assert next(leaves).data == 1
+    assert next(tree.iter_postorder()).data == 1
+
+
+def test_bin_tree_deep_traversal():
+    root = node = BinTreeNode(0)
+    for i in range(1, 5000):
+        node.right = BinTreeNode(i)
+        node = node.right
+
+    assert [n.data for n in BinTree(root).iter_inorder()] == list(range(5000))
+
+
+def test_bin_tree_inorder_node():
+    tree = BinTree.from_iterable(range(10))
+
+    assert tree.root.size == 10
+    assert [tree.inorder_node(i).data for i in range(10)] == list(range(10))
+    assert tree.inorder_node(-1).data == 9
+    with pytest.raises(IndexError):
+        tree.inorder_node(10)
+
+
+def test_bin_tree_inorder_node_with_children_attached_directly():
+    root = BinTreeNode(1)
+    root.left, root.right = BinTreeNode(0), BinTreeNode(3)
+    root.right.left = BinTreeNode(2)
+    tree = BinTree(root)
+
+    assert [tree.inorder_node(i).data for i in range(4)] == [0, 1, 2, 3]
+    assert tree.inorder_node(-1).data == 3
+    with pytest.raises(IndexError):
+        tree.inorder_node(4)
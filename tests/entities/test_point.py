@@ -0,0 +1,54 @@
+from math import isclose
+import pytest
+from PyCompGeomAlgorithms.core import Point, Vector
+
+
+def test_point_has_no_instance_dict():
+    assert not hasattr(Point(1, 2), "__dict__")
+    assert not hasattr(Vector(1, 2), "__dict__")
+
+
+def test_point_direction_matches_cross_product():
+    p1, p2, p3 = Point(1, 1), Point(4, 2), Point(2, 5)
+    v1, v2 = Vector.from_points(p1, p3), Vector.from_points(p1, p2)
+
+    assert Point.direction(p1, p2, p3) == Vector.cross_product(v1, v2)
+    assert Point.direction(p1, p3, p2) == -Point.direction(p1, p2, p3)
+
+
+def test_point_arithmetic():
+    assert Point(1, 2) + Point(3, 4) == Point(4, 6)
+    assert Point(1, 2, 3) - Point(3, 4, 5) == Point(-2, -2, -2)
+    assert isinstance(Point(1, 2) - Point(0, 0), Point)
+
+
+def test_point_dist():
+    assert isclose(Point.dist(Point(0, 0), Point(3, 4)), 5)
+    assert isclose(Point.dist(Point(0, 0, 0), Point(1, 2, 2)), 3)
+    assert Point.dist(Point(0, 0), Point(3, 4), "manhattan") == 7
+
+
+def test_point_coords_in_any_dimension():
+    point, point3d = Point(1, 2), Point(1, 2, 3)
+    point.coords = (5, 6)
+
+    assert point.coords == (5, 6) and (point.x, point.y) == (5, 6)
+    assert point3d.coords == (1, 2, 3) and (point3d.x, point3d.y, point3d.z) == (1, 2, 3)
+    assert Point(7).coords == (7,)
+    assert sorted([Point(2, 1), Point(1, 3), Point(1, 2)]) == [Point(1, 2), Point(1, 3), Point(2, 1)]
+    assert Point(1, 2) < Point(1, 2, 3) and Point(2, 0) > Point(1, 5)
+
+
+def test_point_coordinates_are_read_only():
+    point3d = Point(1, 2, 3)
+    with pytest.raises(AttributeError):
+        point3d.x = 5
+    with pytest.raises(AttributeError):
+        Point(1, 2).y = 5
+
+    point3d.coords = (4,)
+    assert point3d.x == 4 and hash(point3d) == hash((4,))
+    with pytest.raises(IndexError):
+        point3d.y
+    with pytest.raises(IndexError):
+        Point(7).y
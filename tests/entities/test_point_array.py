@@ -0,0 +1,35 @@
+from math import isclose
+from PyCompGeomAlgorithms.core import Point, PointArray
+from PyCompGeomAlgorithms.jarvis import jarvis
+from PyCompGeomAlgorithms.graham import graham
+
+
+def test_point_array_roundtrip():
+    pts = [Point(1, 4), Point(0, 0), Point(3, 3)]
+    arr = PointArray.from_points(pts)
+
+    assert len(arr) == 3
+    assert arr[1] == Point(0, 0)
+    assert arr[-1] == Point(3, 3)
+    assert arr.to_points() == pts
+    assert arr[1:].to_points() == pts[1:]
+
+
+def test_point_array_batched_predicates():
+    pts = [Point(1, 4), Point(0, 0), Point(3, 3), Point(7, 0)]
+    arr = PointArray.from_points(pts)
+    p1, p2 = Point(0, 0), Point(7, 0)
+
+    assert list(arr.direction(p1, p2)) == [Point.direction(p1, p2, p) for p in pts]
+    assert all(isclose(d, Point.dist(p, p2)) for d, p in zip(arr.dist(p2), pts))
+    assert list(arr.dist(p2, "chebyshev")) == [Point.dist(p, p2, "chebyshev") for p in pts]
+    assert list(arr.polar_angle(p1)) == [Point.polar_angle(p, p1) for p in pts]
+    assert arr.centroid() == Point.centroid(*pts)
+
+
+def test_point_array_accepted_by_algorithms():
+    pts = [Point(1, 4), Point(0, 0), Point(3, 3), Point(3, 1), Point(7, 0), Point(9, 6)]
+    arr = PointArray.from_points(pts)
+
+    assert jarvis(arr) == jarvis(pts)
+    assert list(graham(arr))[-1] == list(graham(pts))[-1]
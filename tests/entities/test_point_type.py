@@ -0,0 +1,35 @@
+import pytest
+from PyCompGeomAlgorithms.core import Point, PointType
+
+
+def test_point_type_by_points():
+    source = Point(0, 0)
+
+    assert PointType.by_points(source, Point(2, 0), Point(3, 1), Point(3, -1)) == PointType.convex
+    assert PointType.by_points(source, Point(2, 0), Point(1, 1), Point(1, -1)) == PointType.reflex
+    assert PointType.by_points(source, Point(2, 0), Point(3, -1), Point(1, -1)) == PointType.left_supporting
+    assert PointType.by_points(source, Point(2, 0), Point(3, 1), Point(1, 1)) == PointType.right_supporting
+
+
+def test_point_type_by_points_collinear_neighbour():
+    # Left neighbour lies exactly on the extension of source -> target (angle pi)
+    assert PointType.by_points(Point(-3, 3), Point(-1, 0), Point(1, -3), Point(1, 1)) == PointType.convex
+    assert PointType.by_points(Point(-3, -3), Point(-1, 0), Point(1, 3), Point(-1, -3)) == PointType.convex
+
+
+def test_point_type_by_points_source_is_target():
+    # A zero-length ray target -> source is taken along the x axis
+    assert PointType.by_points(Point(2, 3), Point(2, 3), Point(1, 0), Point(1, 2)) == PointType.right_supporting
+    assert PointType.by_points(Point(0, 0), Point(0, 0), Point(1, 1), Point(1, -1)) == PointType.reflex
+    assert PointType.by_points(Point(0, 0), Point(0, 0), Point(-1, 1), Point(-1, -1)) == PointType.convex
+
+
+def test_point_type_by_points_neighbour_is_target():
+    assert PointType.by_points(Point(6, 6), Point(4, 5), Point(1, 4), Point(4, 5)) == PointType.convex
+    assert PointType.by_points(Point(0, 5), Point(0, 4), Point(0, 1), Point(0, 4)) == PointType.convex
+    assert PointType.by_points(Point(3, 4), Point(2, 5), Point(2, 5), Point(2, 3)) == PointType.reflex
+
+
+def test_point_type_by_points_undefined():
+    with pytest.raises(ValueError):
+        PointType.by_points(Point(2, 3), Point(0, 0), Point(2, 0), Point(-2, 0))
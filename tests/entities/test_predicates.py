@@ -0,0 +1,60 @@
+from fractions import Fraction
+from math import nextafter
+from PyCompGeomAlgorithms.core import Point
+from PyCompGeomAlgorithms.predicates import orientation, incircle, stats, robust_predicates, robust_predicates_enabled
+from PyCompGeomAlgorithms.graham import graham
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+def exact_direction(p1, p2, p3):
+    x1, y1 = Fraction(p1.x), Fraction(p1.y)
+    return (Fraction(p3.x) - x1) * (Fraction(p2.y) - y1) - (Fraction(p3.y) - y1) * (Fraction(p2.x) - x1)
+
+
+def test_orientation_fast_path():
+    stats.reset()
+    p1, p2, p3 = Point(1, 1), Point(4, 2), Point(2, 5)
+
+    assert orientation(p1, p2, p3) == Point.direction(p1, p2, p3)
+    assert (stats.calls, stats.exact_calls) == (1, 0)
+
+
+def test_orientation_near_degenerate():
+    stats.reset()
+    q, r = Point(12.0, 12.0), Point(24.0, 24.0)
+    x = 0.5
+
+    for _ in range(32):
+        y = 0.5
+        for _ in range(32):
+            p = Point(x, y)
+            assert sign(orientation(p, q, r)) == sign(exact_direction(p, q, r))
+            y = nextafter(y, 1)
+        x = nextafter(x, 1)
+
+    assert stats.exact_calls > 0
+
+
+def test_incircle():
+    a, b, c = Point(0, 0), Point(1, 0), Point(0, 1)
+
+    assert incircle(a, b, c, Point(0.5, 0.5)) > 0
+    assert incircle(a, b, c, Point(2, 2)) < 0
+    assert incircle(a, b, c, Point(1, 1)) == 0
+
+
+def test_robust_predicates_switch():
+    pts = [Point(7, 0), Point(3, 3), Point(0, 0), Point(1, 1)]
+    expected = list(graham(list(pts)))[-1]
+
+    assert not robust_predicates_enabled()
+    with robust_predicates() as predicate_stats:
+        predicate_stats.reset()
+        assert robust_predicates_enabled()
+        assert list(graham(list(pts)))[-1] == expected
+        assert predicate_stats.calls > 0
+
+    assert not robust_predicates_enabled()
@@ -58,3 +58,40 @@ def test_threaded_bin_tree_non_circular():
     
     tree = ThreadedBinTree(root)
     assert tree == ThreadedBinTree.from_iterable(["A", "B", "C"], circular=False)
+
+
+def threads(tree):
+    return [(node.prev.data if node.prev else None, node.data, node.next.data if node.next else None) for node in tree.traverse_inorder()]
+
+
+def test_threaded_bin_tree_insertion_keeps_threads():
+    tree = ThreadedBinTree.from_iterable(["B", "D", "F"])
+    for data in ["A", "C", "E", "G", "H"]:
+        tree.insert(data)
+
+    assert all(isinstance(node, ThreadedBinTreeNode) for node in tree.traverse_inorder())
+    assert [node.data for node in tree.traverse_inorder()] == list("ABCDEFGH")
+
+    inserted = threads(tree)
+    tree.rethread()
+    assert inserted == threads(tree)
+
+
+def test_threaded_bin_tree_deletion_keeps_threads():
+    tree = ThreadedBinTree.from_iterable(list("ABCDEFGHI"), circular=False)
+    for data in ["E", "A", "I", "C"]:
+        tree.delete(data)
+
+    assert [node.data for node in tree.traverse_inorder()] == list("BDFGH")
+    assert tree.root.leftmost_node.prev is None and tree.root.rightmost_node.next is None
+
+    deleted = threads(tree)
+    tree.rethread()
+    assert deleted == threads(tree)
+
+
+def test_threaded_bin_tree_insertion_into_empty():
+    tree = ThreadedBinTree.from_iterable([])
+    tree.insert("A")
+
+    assert tree.root.prev is tree.root and tree.root.next is tree.root